@@ -35,11 +35,17 @@ FOV_STEP = math.radians(5.0)
 # Mouse look
 MOUSE_SENS_DEFAULT = 0.012
 
+# Main loop frame cap
+MAX_FPS_DEFAULT = 60
+
 # ASCII fallback shading
 ASCII_WALL_SHADES = "@%#*+=-:."
 ASCII_FLOOR_SHADES = ".,-~:;=!*#$@"
 UNICODE_FLOOR_CHARS = "·⋅∘°ˑ"
 
+# Distance buckets in the precomputed wall shading tables (see Style.wall_lut)
+SHADE_LUT_SIZE = 256
+
 RenderMode = Literal["auto", "text", "half", "braille"]
 Mode = Literal["default", "free", "demo_default", "demo_free"]
 Shadows = Literal["on", "off"]
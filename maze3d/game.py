@@ -26,7 +26,7 @@ from .constants import (
     ROT_SPEED,
 )
 from .i18n import make_tr
-from .maze import difficulty_to_size, find_path_cells, generate_maze, resolve_floor_collision
+from .maze import difficulty_to_size, generate_maze, goal_distances, resolve_floor_collision
 from .models import Player, Settings
 from .movement import (
     demo_free_step,
@@ -36,6 +36,7 @@ from .movement import (
     update_free_vertical,
 )
 from .render import choose_renderer, render_map, render_scene
+from .screen import FrameBuffer
 from .style import Style, detect_caps, effective_style, init_style
 from .ui import confirm_yes_no, run_menu, set_mouse_tracking, win_screen
 from .util import clamp, normalize_angle
@@ -68,8 +69,8 @@ class LevelState:
 
     show_map: bool = False
 
-    demo_path: list[tuple[int, int]] | None = None
-    demo_idx: int = 0
+    # Goal distance field for the demo walker, built on first use per level.
+    demo_dist: list[int] | None = None
 
     start_time: float = 0.0
     hud_until: float = 0.0
@@ -77,6 +78,9 @@ class LevelState:
 
     restart_level: bool = False
 
+    # Inputs of the last rendered frame; see _render_frame().
+    frame_key: tuple | None = None
+
 
 def _configure_mouse(settings: Settings, mouse_possible: bool) -> bool:
     """Apply mouse tracking based on settings. Returns whether mouse is active."""
@@ -103,11 +107,7 @@ def _new_level(
     player = Player(x=1.5, y=1.5, z=0.0, ang=0.0, pitch=0.0, vz=0.0)
     resolve_floor_collision(grid, player)
 
-    demo_path: list[tuple[int, int]] | None = None
-    demo_idx = 0
-    if settings.mode == "demo_default":
-        demo_path = find_path_cells(grid, (int(player.x), int(player.y)), goal_xy)
-        demo_idx = 0
+    demo_dist = goal_distances(grid, goal_xy) if settings.mode == "demo_default" else None
 
     now = time.monotonic()
     hud_until = now + 5.0
@@ -117,8 +117,7 @@ def _new_level(
         goal_xy=goal_xy,
         player=player,
         show_map=False,
-        demo_path=demo_path,
-        demo_idx=demo_idx,
+        demo_dist=demo_dist,
         start_time=now,
         hud_until=hud_until,
         last_tick=now,
@@ -137,6 +136,7 @@ def _hud_visible(settings: Settings, now: float, hud_until: float) -> bool:
 
 def _read_input(
     stdscr,
+    frame: FrameBuffer,
     tr: Callable[[str], str],
     base_style,
     caps,
@@ -156,6 +156,8 @@ def _read_input(
     - "quit"
     """
 
+    # Mouse-look yaw from every motion event drained this tick, applied once.
+    mouse_dx = 0
     while True:
         chkey = stdscr.getch()
         if chkey == -1:
@@ -188,6 +190,7 @@ def _read_input(
         # ESC: pause menu
         if chkey == 27:
             menu_action = run_menu(stdscr, base_style, caps, settings, mode="pause")
+            frame.invalidate()
             if menu_action == "quit":
                 return "quit", style, mouse_active
             if menu_action == "restart":
@@ -197,14 +200,6 @@ def _read_input(
             style = effective_style(base_style, settings)
             mouse_active = _configure_mouse(settings, mouse_possible)
 
-            if settings.mode == "demo_default":
-                level.demo_path = find_path_cells(
-                    level.grid, (int(level.player.x), int(level.player.y)), level.goal_xy
-                )
-                level.demo_idx = 0
-            else:
-                level.demo_path = None
-
             level.last_tick = time.monotonic()
             if settings.hud == "auto5":
                 level.hud_until = level.last_tick + 5.0
@@ -219,6 +214,7 @@ def _read_input(
         if chkey in (ord("q"), ord("Q")):
             if confirm_yes_no(stdscr, tr, "prompt_exit"):
                 return "quit", style, mouse_active
+            frame.invalidate()
             continue
 
         # Arrow keys: camera control (always)
@@ -285,15 +281,13 @@ def _read_input(
 
             if hasattr(curses, "REPORT_MOUSE_POSITION") and (bstate & curses.REPORT_MOUSE_POSITION):
                 if ctrl.last_mouse_x is not None:
-                    dxm = mx - ctrl.last_mouse_x
-                    if dxm:
-                        level.player.ang = normalize_angle(
-                            level.player.ang + dxm * settings.mouse_sens
-                        )
+                    mouse_dx += mx - ctrl.last_mouse_x
                 ctrl.last_mouse_x = mx
             else:
                 ctrl.last_mouse_x = mx
 
+    if mouse_dx:
+        level.player.ang = normalize_angle(level.player.ang + mouse_dx * settings.mouse_sens)
     return "continue", style, mouse_active
 
 
@@ -325,12 +319,9 @@ def _update_simulation(
         player.ang = normalize_angle(player.ang + ctrl.rot_dir * ROT_SPEED * dt * 0.6)
 
     if settings.mode == "demo_default":
-        if level.demo_path is None:
-            level.demo_path = find_path_cells(
-                level.grid, (int(player.x), int(player.y)), level.goal_xy
-            )
-            level.demo_idx = 0
-        level.demo_idx = demo_walk_step(level.grid, player, level.demo_path, level.demo_idx, dt)
+        if level.demo_dist is None:
+            level.demo_dist = goal_distances(level.grid, level.goal_xy)
+        demo_walk_step(level.grid, player, level.demo_dist, dt)
         player.z = 0.0
         player.vz = 0.0
     elif settings.mode == "demo_free":
@@ -352,7 +343,7 @@ def _check_win(level: LevelState) -> bool:
 
 
 def _render_frame(
-    stdscr,
+    frame: FrameBuffer,
     tr: Callable[[str], str],
     level: LevelState,
     settings: Settings,
@@ -360,13 +351,34 @@ def _render_frame(
     hud_visible: bool,
     mouse_active: bool,
 ) -> None:
-    stdscr.erase()
+    # Skip the whole render (raycast included) when nothing it depends on has
+    # changed. Menus and prompts that can change settings invalidate the frame.
+    p = level.player
+    key = (
+        frame.getmaxyx(),
+        level.show_map,
+        p.x,
+        p.y,
+        p.z,
+        p.ang,
+        p.pitch,
+        settings.fov,
+        settings.shadows,
+        style,
+        hud_visible,
+        mouse_active,
+    )
+    if key == level.frame_key and frame.has_frame:
+        return
+    level.frame_key = key
+
+    frame.erase()
     if level.show_map:
-        render_map(stdscr, tr, level.grid, level.player, level.goal_xy, settings, style)
+        render_map(frame, tr, level.grid, level.player, level.goal_xy, settings, style)
     else:
         renderer = choose_renderer(settings, style)
         render_scene(
-            stdscr,
+            frame,
             tr,
             renderer,
             level.grid,
@@ -377,7 +389,7 @@ def _render_frame(
             hud_visible,
             mouse_active,
         )
-    stdscr.refresh()
+    frame.present()
 
 
 def main(stdscr) -> None:
@@ -400,10 +412,12 @@ def main(stdscr) -> None:
         return
 
     rng = random.Random()
+    frame = FrameBuffer(stdscr)
 
     while True:
         level, style, mouse_active = _new_level(settings, base_style, rng, mouse_possible)
         ctrl = ControlState()
+        frame.invalidate()
 
         stdscr.nodelay(True)
         level.restart_level = False
@@ -418,6 +432,7 @@ def main(stdscr) -> None:
 
             action, style, mouse_active = _read_input(
                 stdscr,
+                frame,
                 tr,
                 base_style,
                 caps,
@@ -443,9 +458,18 @@ def main(stdscr) -> None:
                 win_screen(stdscr, tr, seconds, wait=wait)
                 break
 
-            _render_frame(stdscr, tr, level, settings, style, hud_visible, mouse_active)
-
-            time.sleep(0.01)
+            _render_frame(frame, tr, level, settings, style, hud_visible, mouse_active)
+
+            # Wait out whatever is left of this frame's time budget in getch,
+            # so a key press ends the wait early; it is pushed back for the
+            # next frame's input drain.
+            wait_ms = int((1.0 / settings.max_fps - (time.monotonic() - now)) * 1000)
+            if wait_ms > 0:
+                stdscr.timeout(wait_ms)
+                chkey = stdscr.getch()
+                stdscr.nodelay(True)
+                if chkey != -1:
+                    curses.ungetch(chkey)
 
 
 def run() -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import lru_cache
 
 LOCALES: dict[str, dict[str, str]] = {
     "en": {
@@ -190,10 +191,19 @@ LOCALES: dict[str, dict[str, str]] = {
 }
 
 
+@lru_cache(maxsize=8)
 def make_tr(lang: str) -> Callable[[str], str]:
+    """Return the translator for ``lang`` (one shared instance per language).
+
+    The language's strings are merged over English once here, so a lookup is a
+    single dict probe.
+    """
+    base = LOCALES["en"]
+    own = LOCALES.get(lang) or base
+    table = {key: own.get(key) or base.get(key) for key in {**base, **own}}
+
     def tr(key: str, **kwargs) -> str:
-        table = LOCALES.get(lang) or LOCALES["en"]
-        s = table.get(key) or LOCALES["en"].get(key) or key
+        s = table.get(key) or key
         if kwargs:
             try:
                 return s.format(**kwargs)
@@ -204,21 +214,34 @@ def make_tr(lang: str) -> Callable[[str], str]:
     return tr
 
 
+# Option values whose display text comes from an ``opt_*`` locale key.
+_OPTION_KEYS = {
+    "auto": "opt_auto",
+    "on": "opt_on",
+    "off": "opt_off",
+    "text": "opt_text",
+    "half": "opt_half",
+    "braille": "opt_braille",
+    "auto5": "opt_auto5",
+    "always": "opt_always",
+    "default": "opt_default",
+    "free": "opt_free",
+    "demo_default": "opt_demo_default",
+    "demo_free": "opt_demo_free",
+}
+
+# (translator, option key, value) -> display text. Translators come from the
+# cached make_tr(), so there is one entry per language/option/value at most.
+_option_display_cache: dict[tuple[Callable[[str], str], str, str], str] = {}
+
+
 def option_display(tr: Callable[[str], str], key: str, value: str) -> str:
-    mapping = {
-        "auto": "opt_auto",
-        "on": "opt_on",
-        "off": "opt_off",
-        "text": "opt_text",
-        "half": "opt_half",
-        "braille": "opt_braille",
-        "auto5": "opt_auto5",
-        "always": "opt_always",
-        "default": "opt_default",
-        "free": "opt_free",
-        "demo_default": "opt_demo_default",
-        "demo_free": "opt_demo_free",
-    }
-    if key == "language":
-        return (LOCALES.get(value) or LOCALES["en"]).get("lang_name", value)
-    return tr(mapping.get(value, value))
+    cache_key = (tr, key, value)
+    disp = _option_display_cache.get(cache_key)
+    if disp is None:
+        if key == "language":
+            disp = (LOCALES.get(value) or LOCALES["en"]).get("lang_name", value)
+        else:
+            disp = tr(_OPTION_KEYS.get(value, value))
+        _option_display_cache[cache_key] = disp
+    return disp
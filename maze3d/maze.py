@@ -9,6 +9,13 @@ from .constants import FREE_MAX_Z, OPEN, WALL, WALL_HEIGHT
 from .models import Player
 from .util import clamp
 
+# Byte translation table: WALL -> 1, everything else -> 0.
+_WALL_BYTES = bytes(1 if chr(i) == WALL else 0 for i in range(256))
+
+# One-slot cache for wall_mask(); grids are never mutated once generated.
+_wall_mask_cache: tuple[list[str], bytes] | None = None
+_bordered_wall_mask_cache: tuple[list[str], bytes] | None = None
+
 
 def difficulty_to_size(d: int) -> tuple[int, int]:
     d = int(clamp(d, 1, 100))
@@ -22,48 +29,100 @@ def generate_maze(cell_w: int, cell_h: int, rng: random.Random) -> list[str]:
     cell_h = max(2, int(cell_h))
     W = cell_w * 2 + 1
     H = cell_h * 2 + 1
-    grid = [[WALL] * W for _ in range(H)]
-    visited = [[False] * cell_w for _ in range(cell_h)]
-
-    def cell_to_map(cx: int, cy: int) -> tuple[int, int]:
-        return 2 * cx + 1, 2 * cy + 1
-
-    stack = [(0, 0)]
-    visited[0][0] = True
-    sx, sy = cell_to_map(0, 0)
-    grid[sy][sx] = OPEN
+    # Carve into one flat byte buffer. Cells are tracked as (visited index, map
+    # index) pairs; the visited buffer has a one-cell border pre-marked as
+    # visited, so neighbours need no bounds checks.
+    wall = ord(WALL)
+    open_ = ord(OPEN)
+    grid = bytearray([wall]) * (W * H)
+    VW = cell_w + 2
+    visited = bytearray([1]) * (VW * (cell_h + 2))
+    for cy in range(1, cell_h + 1):
+        visited[cy * VW + 1 : cy * VW + 1 + cell_w] = bytes(cell_w)
+    # Neighbour steps in the same order as (-1, 0), (1, 0), (0, -1), (0, 1).
+    dl, dr, du, dd = (-1, -2), (1, 2), (-VW, -2 * W), (VW, 2 * W)
+
+    start = (VW + 1, W + 1)
+    visited[start[0]] = 1
+    grid[start[1]] = open_
+    stack = [start]
 
     while stack:
-        cx, cy = stack[-1]
+        c, m = stack[-1]
         neigh = []
-        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-            nx, ny = cx + dx, cy + dy
-            if 0 <= nx < cell_w and 0 <= ny < cell_h and not visited[ny][nx]:
-                neigh.append((nx, ny))
+        if not visited[c - 1]:
+            neigh.append(dl)
+        if not visited[c + 1]:
+            neigh.append(dr)
+        if not visited[c - VW]:
+            neigh.append(du)
+        if not visited[c + VW]:
+            neigh.append(dd)
         if neigh:
-            nx, ny = rng.choice(neigh)
-            visited[ny][nx] = True
-            x1, y1 = cell_to_map(cx, cy)
-            x2, y2 = cell_to_map(nx, ny)
-            grid[y2][x2] = OPEN
-            grid[(y1 + y2) // 2][(x1 + x2) // 2] = OPEN
-            stack.append((nx, ny))
+            dc, dm = rng.choice(neigh)
+            n = c + dc
+            m2 = m + dm
+            visited[n] = 1
+            grid[m2] = open_
+            grid[m + dm // 2] = open_
+            stack.append((n, m2))
         else:
             stack.pop()
 
-    return ["".join(row) for row in grid]
+    text = grid.decode("latin-1")
+    return [text[y * W : (y + 1) * W] for y in range(H)]
+
+
+def wall_mask(grid: list[str]) -> bytes:
+    """Return the grid as one flat row-major ``bytes`` mask (1 = wall, 0 = open).
+
+    Cell ``(x, y)`` lives at index ``y * W + x`` where ``W = len(grid[0])``, so
+    hot loops do a single index per lookup (and can step by ``1`` or ``W``)
+    instead of chasing a row and then a character. The result is cached for
+    the most recently used grid.
+    """
+    global _wall_mask_cache
+    cached = _wall_mask_cache
+    if cached is not None and cached[0] is grid:
+        return cached[1]
+    mask = "".join(grid).encode("latin-1", "replace").translate(_WALL_BYTES)
+    _wall_mask_cache = (grid, mask)
+    return mask
+
+
+def bordered_wall_mask(grid: list[str]) -> bytes:
+    """:func:`wall_mask` framed by a one-cell ring of 2s marking "off the map".
+
+    Rows are ``W + 2`` wide and cell ``(x, y)`` sits at ``(y + 1) * (W + 2) + x + 1``.
+    A walk that moves one cell at a time from inside the map always stops on a
+    non-zero byte, so it needs no bounds checks.
+    """
+    global _bordered_wall_mask_cache
+    cached = _bordered_wall_mask_cache
+    if cached is not None and cached[0] is grid:
+        return cached[1]
+    walls = wall_mask(grid)
+    max_x = len(grid[0])
+    edge = b"\x02" * (max_x + 2)
+    rows = [edge]
+    for y in range(len(grid)):
+        rows.append(b"\x02" + walls[y * max_x : (y + 1) * max_x] + b"\x02")
+    rows.append(edge)
+    mask = b"".join(rows)
+    _bordered_wall_mask_cache = (grid, mask)
+    return mask
 
 
 def is_wall(grid: list[str], x: int, y: int) -> bool:
     if y < 0 or y >= len(grid) or x < 0 or x >= len(grid[0]):
         return True
-    return grid[y][x] == WALL
+    return wall_mask(grid)[y * len(grid[0]) + x] == 1
 
 
 def cell_floor_height(grid: list[str], x: int, y: int) -> float:
     if y < 0 or y >= len(grid) or x < 0 or x >= len(grid[0]):
         return WALL_HEIGHT
-    return WALL_HEIGHT if grid[y][x] == WALL else 0.0
+    return WALL_HEIGHT if wall_mask(grid)[y * len(grid[0]) + x] else 0.0
 
 
 def can_enter_cell(grid: list[str], x: float, y: float, z_feet: float) -> bool:
@@ -95,26 +154,88 @@ def find_path_cells(
     if not (0 <= sx < W and 0 <= sy < H and 0 <= gx < W and 0 <= gy < H):
         return [start]
 
-    q = deque([start])
-    prev: dict[tuple[int, int], tuple[int, int] | None] = {start: None}
+    # BFS over flat cell indices (y * W + x); prev[i] is the parent index, -1 if unseen.
+    walls = wall_mask(grid)
+    start_i = sy * W + sx
+    goal_i = gy * W + gx
+    prev = [-1] * (W * H)
+    prev[start_i] = start_i
+    q = deque([start_i])
 
     while q:
-        x, y = q.popleft()
-        if (x, y) == goal:
+        i = q.popleft()
+        if i == goal_i:
             break
-        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < W and 0 <= ny < H and grid[ny][nx] == OPEN and (nx, ny) not in prev:
-                prev[(nx, ny)] = (x, y)
-                q.append((nx, ny))
-
-    if goal not in prev:
+        y, x = divmod(i, W)
+        n = i + 1
+        if x + 1 < W and prev[n] < 0 and not walls[n]:
+            prev[n] = i
+            q.append(n)
+        n = i - 1
+        if x > 0 and prev[n] < 0 and not walls[n]:
+            prev[n] = i
+            q.append(n)
+        n = i + W
+        if y + 1 < H and prev[n] < 0 and not walls[n]:
+            prev[n] = i
+            q.append(n)
+        n = i - W
+        if y > 0 and prev[n] < 0 and not walls[n]:
+            prev[n] = i
+            q.append(n)
+
+    if prev[goal_i] < 0:
         return [start]
 
     path: list[tuple[int, int]] = []
-    cur: tuple[int, int] | None = goal
-    while cur is not None:
-        path.append(cur)
-        cur = prev[cur]
+    i = goal_i
+    while i != start_i:
+        path.append((i % W, i // W))
+        i = prev[i]
+    path.append(start)
     path.reverse()
     return path
+
+
+def goal_distances(grid: list[str], goal: tuple[int, int]) -> list[int]:
+    """BFS step count from every cell to ``goal``, as a flat ``y * W + x`` list.
+
+    Walls and cells that cannot reach the goal are -1. One field per level lets
+    the demo walker follow the gradient from wherever the player stands.
+    """
+    H = len(grid)
+    W = len(grid[0]) if H else 0
+    dist = [-1] * (W * H)
+    gx, gy = goal
+    if not (0 <= gx < W and 0 <= gy < H):
+        return dist
+
+    walls = wall_mask(grid)
+    goal_i = gy * W + gx
+    if walls[goal_i]:
+        return dist
+    dist[goal_i] = 0
+    q = deque([goal_i])
+
+    while q:
+        i = q.popleft()
+        d = dist[i] + 1
+        y, x = divmod(i, W)
+        n = i + 1
+        if x + 1 < W and dist[n] < 0 and not walls[n]:
+            dist[n] = d
+            q.append(n)
+        n = i - 1
+        if x > 0 and dist[n] < 0 and not walls[n]:
+            dist[n] = d
+            q.append(n)
+        n = i + W
+        if y + 1 < H and dist[n] < 0 and not walls[n]:
+            dist[n] = d
+            q.append(n)
+        n = i - W
+        if y > 0 and dist[n] < 0 and not walls[n]:
+            dist[n] = d
+            q.append(n)
+
+    return dist
@@ -7,6 +7,7 @@ from typing import Literal
 
 from .constants import (
     FOV_DEFAULT,
+    MAX_FPS_DEFAULT,
     MOUSE_SENS_DEFAULT,
     Mode,
     RenderMode,
@@ -14,7 +15,7 @@ from .constants import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     x: float
     y: float
@@ -38,3 +39,4 @@ class Settings:
     hud: Literal["auto5", "always", "off"] = "auto5"
     fov: float = FOV_DEFAULT
     mouse_sens: float = MOUSE_SENS_DEFAULT
+    max_fps: int = MAX_FPS_DEFAULT
@@ -16,22 +16,29 @@ from .models import Player
 from .util import clamp, normalize_angle
 
 
-def demo_walk_step(
-    grid: list[str], player: Player, path: list[tuple[int, int]], idx: int, dt: float
-) -> int:
-    if not path or idx >= len(path) - 1:
-        return idx
-
-    cur_cell = (int(player.x), int(player.y))
-
-    while idx + 1 < len(path) and cur_cell == path[idx + 1]:
-        idx += 1
-        if idx >= len(path) - 1:
-            return idx
-
-    nxt = path[idx + 1]
-    dx = nxt[0] - cur_cell[0]
-    dy = nxt[1] - cur_cell[1]
+def demo_walk_step(grid: list[str], player: Player, dist: list[int], dt: float) -> None:
+    """Turn towards, then walk into, the neighbouring cell one step closer to the goal.
+
+    ``dist`` is the level's :func:`~maze3d.maze.goal_distances` field, so the
+    walker needs no path state and recovers from any cell it ends up in.
+    """
+    W = len(grid[0])
+    H = len(grid)
+    cx = int(player.x)
+    cy = int(player.y)
+    if not (0 <= cx < W and 0 <= cy < H):
+        return
+    d = dist[cy * W + cx]
+    if d <= 0:
+        return  # at the goal, or it is unreachable from here
+
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        nx = cx + dx
+        ny = cy + dy
+        if 0 <= nx < W and 0 <= ny < H and dist[ny * W + nx] == d - 1:
+            break
+    else:
+        return
 
     if dx > 0:
         desired = 0.0
@@ -47,7 +54,7 @@ def demo_walk_step(
 
     if abs(diff) > 0.07:
         player.ang = normalize_angle(player.ang + clamp(diff, -max_rot, max_rot))
-        return idx
+        return
 
     move = MOVE_SPEED * dt
     dxm = math.cos(player.ang) * move
@@ -61,8 +68,6 @@ def demo_walk_step(
     if not is_wall(grid, int(player.x), int(ny)):
         player.y = ny
 
-    return idx
-
 
 def update_free_vertical(grid: list[str], player: Player, vert_dir: int, dt: float) -> None:
     if vert_dir > 0:
@@ -126,7 +131,8 @@ def demo_free_step(grid: list[str], player: Player, goal_xy: tuple[int, int], dt
         vdir = 0
     update_free_vertical(grid, player, vdir, dt)
 
-    desired = math.atan2(ty - player.y, tx - player.x)
+    # Vertical motion leaves x/y alone, so the heading uses the offsets above.
+    desired = math.atan2(dy, dx)
     diff = normalize_angle(desired - player.ang)
     max_rot = ROT_SPEED * dt
     if abs(diff) > 0.01:
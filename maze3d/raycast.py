@@ -4,55 +4,161 @@ from __future__ import annotations
 
 import curses
 import math
+from functools import lru_cache
 
-from .constants import MAX_RAY_DIST, WALL, WALL_HEIGHT
-from .maze import is_wall
+from .constants import MAX_RAY_DIST, WALL_HEIGHT
+from .maze import bordered_wall_mask, wall_mask
 from .style import Style, flat_floor_attr, flat_wall_attr
 
 
+@lru_cache(maxsize=8)
+def column_rays(fov: float, n: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Per-column ray angle offsets from the view direction, plus fish-eye factors.
+
+    Both depend only on the FOV and the number of columns, so they are computed
+    once per (fov, width) instead of once per frame.
+    """
+    step = fov / max(1, n - 1)
+    offsets = tuple(-fov / 2.0 + x * step for x in range(n))
+    fish = tuple(max(0.0001, math.cos(off)) for off in offsets)
+    return offsets, fish
+
+
+@lru_cache(maxsize=8)
+def column_offset_dirs(fov: float, n: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """(cos, sin) of every column's angle offset; see :func:`column_rays`."""
+    offsets, _fish = column_rays(fov, n)
+    return tuple(math.cos(off) for off in offsets), tuple(math.sin(off) for off in offsets)
+
+
+def view_dirs(ang: float, fov: float, n: int) -> tuple[list[float], list[float]]:
+    """Unit ray direction (cos, sin) tables for ``n`` columns spanning ``fov``.
+
+    Each column's direction is the view direction rotated by its cached offset
+    (angle addition), so a frame costs two trig calls instead of two per column.
+    """
+    off_cos, off_sin = column_offset_dirs(fov, n)
+    c = math.cos(ang)
+    s = math.sin(ang)
+    return (
+        [c * oc - s * os for oc, os in zip(off_cos, off_sin)],
+        [s * oc + c * os for oc, os in zip(off_cos, off_sin)],
+    )
+
+
+# Recent cast_view() results: key -> (grid, (cos_arr, sin_arr, dists, sides)).
+# Grids are never mutated once generated, so a hit stays valid.
+_VIEW_CACHE_SIZE = 4
+_view_cache: dict[tuple, tuple] = {}
+
+
+def cast_view(
+    grid: list[str], px: float, py: float, ang: float, fov: float, n: int
+) -> tuple[list[float], list[float], list[float], list[int]]:
+    """Cast ``n`` screen columns; returns the direction tables plus raw hits.
+
+    Results are cached by exact ray origin and view (a few entries), so frames
+    where only pitch, height, HUD or shading changed skip the DDA entirely. The
+    returned lists are shared with the cache and must not be mutated.
+    """
+    key = (id(grid), px, py, ang, fov, n)
+    hit = _view_cache.get(key)
+    if hit is not None and hit[0] is grid:
+        return hit[1]
+    cos_arr, sin_arr = view_dirs(ang, fov, n)
+    dists, sides = cast_rays(grid, px, py, cos_arr, sin_arr)
+    result = (cos_arr, sin_arr, dists, sides)
+    if len(_view_cache) >= _VIEW_CACHE_SIZE:
+        _view_cache.clear()
+    _view_cache[key] = (grid, result)
+    return result
+
+
 def cast_ray(grid: list[str], px: float, py: float, ang: float) -> tuple[float, int]:
-    ray_dir_x = math.cos(ang)
-    ray_dir_y = math.sin(ang)
-    map_x = int(px)
-    map_y = int(py)
+    dists, sides = cast_rays(grid, px, py, [math.cos(ang)], [math.sin(ang)])
+    return dists[0], sides[0]
 
-    delta_dist_x = 1e30 if ray_dir_x == 0 else abs(1.0 / ray_dir_x)
-    delta_dist_y = 1e30 if ray_dir_y == 0 else abs(1.0 / ray_dir_y)
 
-    if ray_dir_x < 0:
-        step_x = -1
-        side_dist_x = (px - map_x) * delta_dist_x
-    else:
-        step_x = 1
-        side_dist_x = (map_x + 1.0 - px) * delta_dist_x
+def cast_rays(
+    grid: list[str], px: float, py: float, cos_arr: list[float], sin_arr: list[float]
+) -> tuple[list[float], list[int]]:
+    """Batched DDA raycast over precomputed ray directions.
 
-    if ray_dir_y < 0:
-        step_y = -1
-        side_dist_y = (py - map_y) * delta_dist_y
-    else:
-        step_y = 1
-        side_dist_y = (map_y + 1.0 - py) * delta_dist_y
+    This is the single raycasting kernel (:func:`cast_ray` is a one-ray wrapper).
+    Grid bounds and the player cell are resolved once and the DDA runs inline for
+    every ray, so renderers pay no Python call per screen column. The ray walks
+    a flat wall mask framed by an off-map ring (:func:`~maze3d.maze.bordered_wall_mask`) by index,
+    ``+-1`` per x step and ``+-(W + 2)`` per y step, so it needs no bounds
+    checks. Returns raw (not fish-eye corrected) distances and the hit side for
+    each ray; rays starting outside the map or leaving it report ``MAX_RAY_DIST``.
+    """
+    n = len(cos_arr)
+    dists = [MAX_RAY_DIST] * n
+    sides = [0] * n
 
     max_y = len(grid)
     max_x = len(grid[0])
+    cell_x = int(px)
+    cell_y = int(py)
+    if not (0 <= cell_x < max_x and 0 <= cell_y < max_y):
+        return dists, sides
+    walls = bordered_wall_mask(grid)
+    stride = max_x + 2
+    start_cell = (cell_y + 1) * stride + cell_x + 1
+    frac_x0 = px - cell_x
+    frac_x1 = cell_x + 1.0 - px
+    frac_y0 = py - cell_y
+    frac_y1 = cell_y + 1.0 - py
 
-    side = 0
-    while True:
-        if side_dist_x < side_dist_y:
-            side_dist_x += delta_dist_x
-            map_x += step_x
-            side = 0
+    max_dist = MAX_RAY_DIST
+    for i in range(n):
+        ray_dir_x = cos_arr[i]
+        ray_dir_y = sin_arr[i]
+        cell = start_cell
+
+        # delta_dist = |1 / ray_dir| (1e30 for axis-parallel rays); the sign is
+        # known in each branch, so no abs() call is needed.
+        if ray_dir_x < 0:
+            step_x = -1
+            delta_dist_x = -1.0 / ray_dir_x
+            side_dist_x = frac_x0 * delta_dist_x
+        else:
+            step_x = 1
+            delta_dist_x = 1.0 / ray_dir_x if ray_dir_x else 1e30
+            side_dist_x = frac_x1 * delta_dist_x
+
+        if ray_dir_y < 0:
+            stride_y = -stride
+            delta_dist_y = -1.0 / ray_dir_y
+            side_dist_y = frac_y0 * delta_dist_y
         else:
-            side_dist_y += delta_dist_y
-            map_y += step_y
-            side = 1
+            stride_y = stride
+            delta_dist_y = 1.0 / ray_dir_y if ray_dir_y else 1e30
+            side_dist_y = frac_y1 * delta_dist_y
 
-        if map_x < 0 or map_x >= max_x or map_y < 0 or map_y >= max_y:
-            return MAX_RAY_DIST, side
+        # The border ring stops every ray, so the walk needs no bounds checks.
+        while True:
+            if side_dist_x < side_dist_y:
+                side_dist_x += delta_dist_x
+                cell += step_x
+                hit = walls[cell]
+                if hit:
+                    if hit == 1:
+                        dist = side_dist_x - delta_dist_x
+                        dists[i] = dist if dist < max_dist else max_dist
+                    break
+            else:
+                side_dist_y += delta_dist_y
+                cell += stride_y
+                hit = walls[cell]
+                if hit:
+                    if hit == 1:
+                        dist = side_dist_y - delta_dist_y
+                        dists[i] = dist if dist < max_dist else max_dist
+                    sides[i] = 1
+                    break
 
-        if grid[map_y][map_x] == WALL:
-            dist = (side_dist_x - delta_dist_x) if side == 0 else (side_dist_y - delta_dist_y)
-            return min(max(dist, 0.0), MAX_RAY_DIST), side
+    return dists, sides
 
 
 def pitch_mid(height: float, pitch: float) -> float:
@@ -69,6 +175,39 @@ def compute_wall_span(height: int, dist: float, cam_z: float, mid: float) -> tup
     return top, bot
 
 
+def wall_spans(
+    height: int, dists: list[float], fish: tuple[float, ...], cam_z: float, mid: float
+) -> tuple[list[float], list[int], list[int]]:
+    """Fish-eye correct raw ray distances and project them to wall spans.
+
+    Batched form of :func:`compute_wall_span` for a whole frame: returns the
+    corrected distances plus the top/bottom screen rows of every column, with
+    the per-frame terms hoisted out of the column loop.
+    """
+    n = len(dists)
+    corrected = [0.0] * n
+    tops = [0] * n
+    bots = [0] * n
+    proj_plane = height * 1.25
+    top_h = WALL_HEIGHT - cam_z
+    bot_h = 0.0 - cam_z
+
+    for i in range(n):
+        dist = dists[i] * fish[i]
+        if dist < 0.0001:
+            dist = 0.0001
+        proj = proj_plane / dist
+        top = int(mid - top_h * proj)
+        bot = int(mid - bot_h * proj)
+        if top > bot:
+            top, bot = bot, top
+        corrected[i] = dist
+        tops[i] = top
+        bots[i] = bot
+
+    return corrected, tops, bots
+
+
 def floorcast_sample_row(
     grid: list[str],
     px: float,
@@ -79,9 +218,16 @@ def floorcast_sample_row(
     dist_plane_top: float | None,
     style: Style,
     shadows_on: bool,
+    out: list[bool] | None = None,
 ) -> tuple[list[bool], str, int, str, int]:
+    """Sample one floorcast row.
+
+    Returns the per-column "hits a wall top" mask plus the floor and wall-top
+    char/attr for the row. Pass ``out`` (a list of ``len(cos_arr)`` bools) to have
+    the mask written in place when there is a wall-top plane, so renderers can
+    reuse one buffer for every row.
+    """
     cols = len(cos_arr)
-    hit_top = [False] * cols
 
     if shadows_on:
         d_floor = min(dist_plane, MAX_RAY_DIST)
@@ -100,11 +246,63 @@ def floorcast_sample_row(
             d_top = min(dist_plane_top, MAX_RAY_DIST)
             top_ch = style.wall_char_top(d_top)
             top_attr = style.wall_attr(d_top, 0) if style.colors_ok else curses.A_BOLD
-        # compute top hit mask (same in both modes)
+        # compute top hit mask (same in both modes); off-map samples count as walls
+        hit_top = [False] * cols if out is None else out
+        walls = wall_mask(grid)
+        max_y = len(grid)
+        max_x = len(grid[0])
         for i in range(cols):
-            wx = px + cos_arr[i] * dist_plane_top
-            wy = py + sin_arr[i] * dist_plane_top
-            if is_wall(grid, int(wx), int(wy)):
-                hit_top[i] = True
+            mx = int(px + cos_arr[i] * dist_plane_top)
+            my = int(py + sin_arr[i] * dist_plane_top)
+            hit_top[i] = (
+                mx < 0 or mx >= max_x or my < 0 or my >= max_y or walls[my * max_x + mx] == 1
+            )
+    else:
+        hit_top = [False] * cols
 
     return hit_top, floor_ch, floor_attr, top_ch, top_attr
+
+
+def floor_plane_numerators(cam_z: float, proj_plane: float) -> tuple[float, float | None]:
+    """Per-frame numerators of the floor and wall-top plane distances.
+
+    A row ``den`` pixel rows below the horizon sees the floor at ``num_floor / den``
+    and, with the camera above the walls, the wall tops at ``num_top / den``
+    (``num_top`` is None otherwise).
+    """
+    num_top = None
+    if cam_z > WALL_HEIGHT + 0.02:
+        num_top = (cam_z - WALL_HEIGHT) * proj_plane
+    return cam_z * proj_plane, num_top
+
+
+def floorcast_row(
+    grid: list[str],
+    px: float,
+    py: float,
+    cos_arr: list[float],
+    sin_arr: list[float],
+    num_floor: float,
+    num_top: float | None,
+    den: float,
+    style: Style,
+    shadows_on: bool,
+    out: list[bool] | None = None,
+) -> tuple[list[bool], str, int, str, int] | None:
+    """Floorcast one screen row; returns None when it is at or above the horizon.
+
+    ``den`` is how far the row lies below the horizon, in the renderer's own
+    pixel rows, and the numerators come from :func:`floor_plane_numerators`.
+    Projects the floor and wall-top planes, then defers to
+    :func:`floorcast_sample_row`.
+    """
+    if den <= 0.0001:
+        return None
+    dist_top = None
+    if num_top is not None:
+        dist_top = num_top / den
+        if dist_top <= 0:
+            dist_top = None
+    return floorcast_sample_row(
+        grid, px, py, cos_arr, sin_arr, num_floor / den, dist_top, style, shadows_on, out=out
+    )
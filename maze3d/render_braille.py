@@ -3,27 +3,35 @@
 from __future__ import annotations
 
 import curses
-import math
 from collections.abc import Callable
 
-from .constants import EYE_HEIGHT, WALL_HEIGHT
+from .constants import EYE_HEIGHT
 from .models import Player, Settings
-from .raycast import cast_ray, compute_wall_span, floorcast_sample_row, pitch_mid
-from .render_common import draw_hud
+from .raycast import (
+    cast_view,
+    column_rays,
+    floor_plane_numerators,
+    floorcast_row,
+    pitch_mid,
+    view_dirs,
+    wall_spans,
+)
+from .render_common import draw_hud, draw_row
 from .render_text import render_text
-from .style import Style, flat_floor_attr, flat_wall_attr
+from .style import DIST_LUT_SCALE, Style, flat_floor_attr, flat_wall_attr
 from .util import safe_addstr
 
-_BRAILLE_BITS = {
-    (0, 0): 0x01,
-    (0, 1): 0x02,
-    (0, 2): 0x04,
-    (0, 3): 0x40,
-    (1, 0): 0x08,
-    (1, 1): 0x10,
-    (1, 2): 0x20,
-    (1, 3): 0x80,
-}
+# Braille dot bits per (sub-column, sub-row).
+_BRAILLE_BITS = ((0x01, 0x02, 0x04, 0x40), (0x08, 0x10, 0x20, 0x80))
+
+# Dot bits lit by a wall covering sub-rows [lo, hi) of a cell, per sub-column,
+# indexed by lo * 5 + hi (0 when hi <= lo).
+_SPAN_BITS = tuple(
+    tuple(sum(col[lo:hi]) for lo in range(5) for hi in range(5)) for col in _BRAILLE_BITS
+)
+
+# Braille glyph for every dot mask.
+_BRAILLE_GLYPHS = tuple(chr(0x2800 + bits) for bits in range(256))
 
 
 def render_braille(
@@ -56,6 +64,7 @@ def render_braille(
     view_h = max(1, h - hud_lines)
     view_w = max(1, w - 1)
     fov = settings.fov
+    px, py = player.x, player.y
     cam_z = player.z + EYE_HEIGHT
 
     sub_w = view_w * 2
@@ -64,31 +73,64 @@ def render_braille(
 
     use_floorcast = cam_z > 0.75 or abs(player.pitch) > 0.25
     proj_plane = pix_h * 1.25
-
-    dist_sub = [0.0] * sub_w
-    side_sub = [0] * sub_w
-    top_p = [0] * sub_w
-    bot_p = [0] * sub_w
-    cos_col = [0.0] * view_w
-    sin_col = [0.0] * view_w
-
-    for x in range(view_w):
-        ray_ang = player.ang - fov / 2.0 + (x / max(1, view_w - 1)) * fov
-        cos_col[x] = math.cos(ray_ang)
-        sin_col[x] = math.sin(ray_ang)
-
+    num_floor, num_top = floor_plane_numerators(cam_z, proj_plane)
+
+    # Walls are cast at sub-column (2x) resolution; floorcasting samples one ray
+    # per terminal column.
+    _sub_offsets, sub_fish = column_rays(fov, sub_w)
+    _cos_sub, _sin_sub, dist_sub, side_sub = cast_view(grid, px, py, player.ang, fov, sub_w)
+    dist_sub, top_p, bot_p = wall_spans(pix_h, dist_sub, sub_fish, cam_z, mid_pix)
+    cos_col, sin_col = view_dirs(player.ang, fov, view_w)
+
+    # A cell's wall attr comes from the nearer of its two sub-columns.
+    if shadows_on:
+        _lut_chars, lut_attrs0, lut_attrs1 = style.wall_lut
+        col_attr = [0] * view_w
+        for xi in range(view_w):
+            sx = 2 * xi
+            if dist_sub[sx] <= dist_sub[sx + 1]:
+                d = dist_sub[sx]
+                side = side_sub[sx]
+            else:
+                d = dist_sub[sx + 1]
+                side = side_sub[sx + 1]
+            b = int(d * DIST_LUT_SCALE)
+            col_attr[xi] = lut_attrs1[b] if side else lut_attrs0[b]
+    else:
+        col_attr = [wall_attr_flat] * view_w
+
+    # Dot bits of every cell, filled column by column over the rows each wall
+    # span actually covers: the first and last cell rows are partial, the ones
+    # in between light the sub-column's full dot column.
+    cell_bits = [[0] * view_w for _ in range(view_h)]
     for sx in range(sub_w):
-        ray_ang = player.ang - fov / 2.0 + (sx / max(1, sub_w - 1)) * fov
-        dist, side = cast_ray(grid, player.x, player.y, ray_ang)
-        dist *= max(0.0001, math.cos(ray_ang - player.ang))
-        dist = max(0.0001, dist)
-
-        dist_sub[sx] = dist
-        side_sub[sx] = side
-
-        tp, bp = compute_wall_span(pix_h, dist, cam_z, mid_pix)
-        top_p[sx] = tp
-        bot_p[sx] = bp
+        top = top_p[sx]
+        bot = bot_p[sx]
+        if top < 0:
+            top = 0
+        if bot > pix_h:
+            bot = pix_h
+        if bot <= top:
+            continue
+        span_bits = _SPAN_BITS[sx & 1]
+        xi = sx >> 1
+        y0 = top >> 2
+        y1 = (bot - 1) >> 2
+        if y0 == y1:
+            base = 4 * y0
+            cell_bits[y0][xi] |= span_bits[(top - base) * 5 + bot - base]
+            continue
+        cell_bits[y0][xi] |= span_bits[(top - 4 * y0) * 5 + 4]
+        full = span_bits[4]
+        for y in range(y0 + 1, y1):
+            cell_bits[y][xi] |= full
+        cell_bits[y1][xi] |= span_bits[bot - 4 * y1]
+
+    grad_chars, grad_attrs = style.floor_grad_lut(view_h)
+    row_chars = [" "] * view_w
+    row_attrs = [0] * view_w
+    top_mask = [False] * view_w
+    sky_attr = curses.A_NORMAL
 
     for y in range(view_h):
         row_top_mask = None
@@ -98,85 +140,42 @@ def render_braille(
         top_attr = wall_attr_flat
 
         if use_floorcast:
-            py = y * 4 + 2
-            den = (py + 0.5) - mid_pix
-            if den > 0.0001:
-                dist_floor = cam_z * proj_plane / den
-                dist_top = None
-                if cam_z > WALL_HEIGHT + 0.02:
-                    dist_top = (cam_z - WALL_HEIGHT) * proj_plane / den
-                    if dist_top <= 0:
-                        dist_top = None
-                row_top_mask, floor_ch, floor_attr, top_ch, top_attr = floorcast_sample_row(
-                    grid,
-                    player.x,
-                    player.y,
-                    cos_col,
-                    sin_col,
-                    dist_floor,
-                    dist_top,
-                    style,
-                    shadows_on,
-                )
-        x = 0
-        while x < view_w:
-
-            def cell(
-                xi: int,
-                *,
-                y=y,
-                row_top_mask=row_top_mask,
-                floor_ch=floor_ch,
-                floor_attr=floor_attr,
-                top_ch=top_ch,
-                top_attr=top_attr,
-            ) -> tuple[str, int]:
-                bits = 0
-                for sub_col in (0, 1):
-                    sx = 2 * xi + sub_col
-                    tp = top_p[sx]
-                    bp = bot_p[sx]
-                    base_y = 4 * y
-                    for sub_row in range(4):
-                        py = base_y + sub_row
-                        if tp <= py < bp:
-                            bits |= _BRAILLE_BITS[(sub_col, sub_row)]
-
-                if bits:
-                    sx0 = 2 * xi
-                    sx1 = sx0 + 1
-                    if dist_sub[sx0] <= dist_sub[sx1]:
-                        d = dist_sub[sx0]
-                        side = side_sub[sx0]
-                    else:
-                        d = dist_sub[sx1]
-                        side = side_sub[sx1]
-                    attr = style.wall_attr(d, side) if shadows_on else wall_attr_flat
-                    return chr(0x2800 + bits), attr
-
-                if use_floorcast and row_top_mask is not None:
-                    if row_top_mask[xi]:
-                        return top_ch, top_attr
-                    return floor_ch, floor_attr
-
-                if y < view_h // 2:
-                    return " ", curses.A_NORMAL
-
-                if shadows_on:
-                    return style.floor_char_grad(y, view_h), style.floor_attr_grad(y, view_h)
-                return floor_ch_flat, floor_attr_flat
-
-            ch, attr = cell(x)
-            start = x
-            buf = [ch]
-            x += 1
-            while x < view_w:
-                ch2, attr2 = cell(x)
-                if attr2 != attr:
-                    break
-                buf.append(ch2)
-                x += 1
-            safe_addstr(stdscr, y, start, "".join(buf), attr)
+            pix_y = y * 4 + 2
+            den = (pix_y + 0.5) - mid_pix
+            sample = floorcast_row(
+                grid, px, py, cos_col, sin_col, num_floor, num_top, den, style, shadows_on, top_mask
+            )
+            if sample is not None:
+                row_top_mask, floor_ch, floor_attr, top_ch, top_attr = sample
+
+        if row_top_mask is None:
+            if y < view_h // 2:
+                bg_ch = " "
+                bg_attr = sky_attr
+            elif shadows_on:
+                bg_ch = grad_chars[y]
+                bg_attr = grad_attrs[y]
+            else:
+                bg_ch = floor_ch_flat
+                bg_attr = floor_attr_flat
+
+        bits_row = cell_bits[y]
+        for xi in range(view_w):
+            bits = bits_row[xi]
+            if bits:
+                row_chars[xi] = _BRAILLE_GLYPHS[bits]
+                row_attrs[xi] = col_attr[xi]
+            elif row_top_mask is None:
+                row_chars[xi] = bg_ch
+                row_attrs[xi] = bg_attr
+            elif row_top_mask[xi]:
+                row_chars[xi] = top_ch
+                row_attrs[xi] = top_attr
+            else:
+                row_chars[xi] = floor_ch
+                row_attrs[xi] = floor_attr
+
+        draw_row(stdscr, y, row_chars, row_attrs)
 
     if hud_visible:
         draw_hud(stdscr, tr, player, goal_xy, settings, style, mouse_active)
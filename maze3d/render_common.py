@@ -5,6 +5,7 @@ from __future__ import annotations
 import curses
 import math
 from collections.abc import Callable
+from itertools import groupby
 
 from .constants import RenderMode
 from .i18n import option_display
@@ -22,21 +23,39 @@ def choose_renderer(settings: Settings, style: Style) -> RenderMode:
     return "braille" if style.unicode_ok else "text"
 
 
-def draw_hud(
-    stdscr,
+def draw_row(stdscr, y: int, chars: list[str], attrs: list[int]) -> None:
+    """Draw a full scanline with one ``addstr`` per run of equal attributes.
+
+    The line is joined once and each run is a slice of it. Run boundaries are
+    found by :func:`itertools.groupby`, so Python only loops once per run
+    rather than once per column.
+
+    Runs are written left to right, so once one fails (off the bottom or right
+    edge) every later run would too; a single ``try`` covers the whole row.
+    """
+    line = "".join(chars)
+    addstr = stdscr.addstr
+    x = 0
+    try:
+        for attr, run in groupby(attrs):
+            start = x
+            x += len(list(run))
+            addstr(y, start, line[start:x], attr)
+    except curses.error:
+        pass
+
+
+# One-slot cache for the HUD text: (inputs key, (line1, line2)).
+_hud_lines_cache: tuple[tuple, tuple[str, str]] | None = None
+
+
+def _hud_lines(
     tr: Callable[[str], str],
-    player: Player,
-    goal_xy: tuple[int, int],
+    dist_goal: float,
     settings: Settings,
     style: Style,
     mouse_active: bool,
-) -> None:
-    """Draw 2-line HUD at the bottom of the screen."""
-    h, w = stdscr.getmaxyx()
-
-    gx, gy = goal_xy
-    dist_goal = math.hypot((gx + 0.5) - player.x, (gy + 0.5) - player.y)
-
+) -> tuple[str, str]:
     is_free = settings.mode in ("free", "demo_free")
     line1 = tr("hud_line1_free") if is_free else tr("hud_line1_default")
 
@@ -70,9 +89,51 @@ def draw_hud(
         render=render_disp,
         tags=tag_str,
     )
+    return line1, line2
+
+
+def draw_hud(
+    stdscr,
+    tr: Callable[[str], str],
+    player: Player,
+    goal_xy: tuple[int, int],
+    settings: Settings,
+    style: Style,
+    mouse_active: bool,
+) -> None:
+    """Draw 2-line HUD at the bottom of the screen.
+
+    The text is rebuilt only when something it shows changes; the goal distance
+    is keyed at the one decimal the HUD displays.
+    """
+    global _hud_lines_cache
+    h, w = stdscr.getmaxyx()
+
+    gx, gy = goal_xy
+    dist_goal = math.hypot((gx + 0.5) - player.x, (gy + 0.5) - player.y)
+
+    key = (
+        tr,
+        f"{dist_goal:.1f}",
+        settings.mode,
+        settings.difficulty,
+        settings.fov,
+        settings.render_mode,
+        settings.shadows,
+        style.unicode_ok,
+        style.colors_ok,
+        style.color_mode,
+        mouse_active,
+    )
+    cached = _hud_lines_cache
+    if cached is not None and cached[0] == key:
+        line1, line2 = cached[1]
+    else:
+        line1, line2 = _hud_lines(tr, dist_goal, settings, style, mouse_active)
+        _hud_lines_cache = (key, (line1, line2))
 
     attr = curses.A_BOLD
     if style.colors_ok and style.hud_pair:
-        attr |= curses.color_pair(style.hud_pair)
+        attr |= style.pair_attrs[style.hud_pair]
     safe_addstr(stdscr, h - 2, 0, line1[: max(0, w - 1)], attr)
     safe_addstr(stdscr, h - 1, 0, line2[: max(0, w - 1)], attr)
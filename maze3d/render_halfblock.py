@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import curses
-import math
 from collections.abc import Callable
 
-from .constants import EYE_HEIGHT, WALL_HEIGHT
+from .constants import EYE_HEIGHT
 from .models import Player, Settings
-from .raycast import cast_ray, compute_wall_span, floorcast_sample_row, pitch_mid
-from .render_common import draw_hud
+from .raycast import (
+    cast_view,
+    column_rays,
+    floor_plane_numerators,
+    floorcast_row,
+    pitch_mid,
+    wall_spans,
+)
+from .render_common import draw_hud, draw_row
 from .style import Style, flat_floor_attr, flat_wall_attr
 from .util import safe_addstr
 
@@ -41,6 +47,7 @@ def render_halfblock(
     view_h = max(1, h - hud_lines)
     view_w = max(1, w - 1)
     fov = settings.fov
+    px, py = player.x, player.y
     cam_z = player.z + EYE_HEIGHT
 
     pix_h = view_h * 2
@@ -48,38 +55,51 @@ def render_halfblock(
 
     use_floorcast = cam_z > 0.75 or abs(player.pitch) > 0.25
     proj_plane = pix_h * 1.25
-
-    top_pix = [0] * view_w
-    bot_pix = [0] * view_w
-    attr_col = [0] * view_w
-    full_char_col = ["█"] * view_w
-    cos_arr = [0.0] * view_w
-    sin_arr = [0.0] * view_w
-
+    num_floor, num_top = floor_plane_numerators(cam_z, proj_plane)
+
+    _offsets, fish = column_rays(fov, view_w)
+    cos_arr, sin_arr, dists, sides = cast_view(grid, px, py, player.ang, fov, view_w)
+    dists, top_pix, bot_pix = wall_spans(pix_h, dists, fish, cam_z, mid_pix)
+
+    if shadows_on:
+        shade_chars, attr_col = style.wall_shades(dists, sides)
+        # With colors the distance shading is in the attr; keep solid blocks.
+        full_char_col = shade_chars if not style.colors_ok else ["█"] * view_w
+    else:
+        attr_col = [wall_attr_flat] * view_w
+        full_char_col = ["█" if style.unicode_ok else "#"] * view_w
+
+    # Wall coverage of every cell (0 = none, 1 = lower half, 2 = upper half,
+    # 3 = both), filled column by column over only the rows each span touches,
+    # so sky/floor cells cost nothing here.
+    cell_codes = [[0] * view_w for _ in range(view_h)]
     for x in range(view_w):
-        ray_ang = player.ang - fov / 2.0 + (x / max(1, view_w - 1)) * fov
-        cos_arr[x] = math.cos(ray_ang)
-        sin_arr[x] = math.sin(ray_ang)
-
-        dist, side = cast_ray(grid, player.x, player.y, ray_ang)
-        dist *= max(0.0001, math.cos(ray_ang - player.ang))
-        dist = max(0.0001, dist)
-
-        tp, bp = compute_wall_span(pix_h, dist, cam_z, mid_pix)
-        top_pix[x] = tp
-        bot_pix[x] = bp
-
-        if shadows_on:
-            attr_col[x] = style.wall_attr(dist, side)
-            full_char_col[x] = style.wall_char_text(dist) if not style.colors_ok else "█"
-        else:
-            attr_col[x] = wall_attr_flat
-            full_char_col[x] = "█" if style.unicode_ok else "#"
+        tp = top_pix[x]
+        bp = bot_pix[x]
+        if tp < 0:
+            tp = 0
+        if bp > pix_h:
+            bp = pix_h
+        if bp <= tp:
+            continue
+        y0 = tp >> 1
+        y1 = (bp - 1) >> 1
+        # Only the first and last rows can be partially covered.
+        cell_codes[y0][x] = (tp <= 2 * y0) * 2 + (2 * y0 + 1 < bp)
+        for y in range(y0 + 1, y1):
+            cell_codes[y][x] = 3
+        if y1 > y0:
+            cell_codes[y1][x] = 2 + (2 * y1 + 1 < bp)
+
+    # Glyph per wall-coverage code; "" falls back to the column's full-cell char.
+    half_glyphs = ("", "▄", "▀", "") if style.unicode_ok else ("", "", "", "")
+    grad_chars, grad_attrs = style.floor_grad_lut(view_h)
+    row_chars = [" "] * view_w
+    row_attrs = [0] * view_w
+    top_mask = [False] * view_w
+    sky_attr = curses.A_NORMAL
 
     for y in range(view_h):
-        y_top = 2 * y
-        y_bot = y_top + 1
-
         row_top_mask = None
         floor_ch = floor_ch_flat
         floor_attr = floor_attr_flat
@@ -87,75 +107,41 @@ def render_halfblock(
         top_attr = wall_attr_flat
 
         if use_floorcast:
-            den = (y_bot + 0.5) - mid_pix
-            if den > 0.0001:
-                dist_floor = cam_z * proj_plane / den
-                dist_top = None
-                if cam_z > WALL_HEIGHT + 0.02:
-                    dist_top = (cam_z - WALL_HEIGHT) * proj_plane / den
-                    if dist_top <= 0:
-                        dist_top = None
-                row_top_mask, floor_ch, floor_attr, top_ch, top_attr = floorcast_sample_row(
-                    grid,
-                    player.x,
-                    player.y,
-                    cos_arr,
-                    sin_arr,
-                    dist_floor,
-                    dist_top,
-                    style,
-                    shadows_on,
-                )
-        x = 0
-        while x < view_w:
-
-            def cell(
-                xi: int,
-                *,
-                y=y,
-                y_top=y_top,
-                y_bot=y_bot,
-                row_top_mask=row_top_mask,
-                floor_ch=floor_ch,
-                floor_attr=floor_attr,
-                top_ch=top_ch,
-                top_attr=top_attr,
-            ) -> tuple[str, int]:
-                tp = top_pix[xi]
-                bp = bot_pix[xi]
-
-                top_on = tp <= y_top < bp
-                bot_on = tp <= y_bot < bp
-                if top_on and bot_on:
-                    return full_char_col[xi], attr_col[xi]
-                if top_on and not bot_on:
-                    return ("▀" if style.unicode_ok else full_char_col[xi]), attr_col[xi]
-                if not top_on and bot_on:
-                    return ("▄" if style.unicode_ok else full_char_col[xi]), attr_col[xi]
-
-                if use_floorcast and row_top_mask is not None:
-                    if row_top_mask[xi]:
-                        return top_ch, top_attr
-                    return floor_ch, floor_attr
-
-                if y < view_h // 2:
-                    return " ", curses.A_NORMAL
-
-                if shadows_on:
-                    return style.floor_char_grad(y, view_h), style.floor_attr_grad(y, view_h)
-                return floor_ch_flat, floor_attr_flat
-
-            ch, attr = cell(x)
-            start = x
-            buf = [ch]
-            x += 1
-            while x < view_w:
-                ch2, attr2 = cell(x)
-                if attr2 != attr:
-                    break
-                buf.append(ch2)
-                x += 1
-            safe_addstr(stdscr, y, start, "".join(buf), attr)
+            den = (2 * y + 1.5) - mid_pix
+            sample = floorcast_row(
+                grid, px, py, cos_arr, sin_arr, num_floor, num_top, den, style, shadows_on, top_mask
+            )
+            if sample is not None:
+                row_top_mask, floor_ch, floor_attr, top_ch, top_attr = sample
+
+        if row_top_mask is None:
+            if y < view_h // 2:
+                bg_ch = " "
+                bg_attr = sky_attr
+            elif shadows_on:
+                bg_ch = grad_chars[y]
+                bg_attr = grad_attrs[y]
+            else:
+                bg_ch = floor_ch_flat
+                bg_attr = floor_attr_flat
+
+        codes_row = cell_codes[y]
+        for x in range(view_w):
+            code = codes_row[x]
+            if code:
+                row_chars[x] = half_glyphs[code] or full_char_col[x]
+                row_attrs[x] = attr_col[x]
+            elif row_top_mask is None:
+                row_chars[x] = bg_ch
+                row_attrs[x] = bg_attr
+            elif row_top_mask[x]:
+                row_chars[x] = top_ch
+                row_attrs[x] = top_attr
+            else:
+                row_chars[x] = floor_ch
+                row_attrs[x] = floor_attr
+
+        draw_row(stdscr, y, row_chars, row_attrs)
 
     if hud_visible:
         draw_hud(stdscr, tr, player, goal_xy, settings, style, mouse_active)
@@ -6,29 +6,25 @@ import curses
 import math
 from collections.abc import Callable
 
-from .constants import WALL
+from .maze import wall_mask
 from .models import Player, Settings
+from .render_common import draw_row
 from .style import Style
 from .util import normalize_angle, safe_addstr
 
+# Direction glyphs by quadrant: east, south, west, north (screen y grows down).
+_DIR_GLYPHS_UNICODE = ("►", "▼", "◄", "▲")
+_DIR_GLYPHS_ASCII = (">", "v", "<", "^")
+
+# One-slot cache for _map_rows(): (grid, style, (out_h, out_w), rows).
+_map_rows_cache: tuple | None = None
+
 
 def player_dir_glyph(style: Style, ang: float) -> str:
-    a = normalize_angle(ang)
-    if not style.unicode_ok:
-        if -math.pi / 4 <= a < math.pi / 4:
-            return ">"
-        if math.pi / 4 <= a < 3 * math.pi / 4:
-            return "v"
-        if -3 * math.pi / 4 <= a < -math.pi / 4:
-            return "^"
-        return "<"
-    if -math.pi / 4 <= a < math.pi / 4:
-        return "►"
-    if math.pi / 4 <= a < 3 * math.pi / 4:
-        return "▼"
-    if -3 * math.pi / 4 <= a < -math.pi / 4:
-        return "▲"
-    return "◄"
+    # Quadrant 0 is [-pi/4, pi/4); the floor division yields -2..2 for
+    # [-pi, pi), and & 3 folds -2/-1 onto west/north.
+    q = int((normalize_angle(ang) + math.pi / 4) // (math.pi / 2)) & 3
+    return (_DIR_GLYPHS_UNICODE if style.unicode_ok else _DIR_GLYPHS_ASCII)[q]
 
 
 def render_map(
@@ -56,7 +52,7 @@ def render_map(
     title = tr("map_title")
     hdr_attr = curses.A_REVERSE
     if style.colors_ok and style.hud_pair:
-        hdr_attr |= curses.color_pair(style.hud_pair)
+        hdr_attr |= style.pair_attrs[style.hud_pair]
     safe_addstr(stdscr, 0, 0, title[: max(0, w - 1)], hdr_attr)
 
     gx, gy = goal_xy
@@ -69,28 +65,95 @@ def render_map(
     goal_attr = curses.A_BOLD
     if style.colors_ok:
         if style.map_wall_pair:
-            wall_attr = curses.color_pair(style.map_wall_pair)
+            wall_attr = style.pair_attrs[style.map_wall_pair]
         if style.map_floor_pair:
-            floor_attr = curses.color_pair(style.map_floor_pair)
+            floor_attr = style.pair_attrs[style.map_floor_pair]
         if style.map_player_pair:
-            player_attr = curses.color_pair(style.map_player_pair) | curses.A_BOLD
+            player_attr = style.pair_attrs[style.map_player_pair] | curses.A_BOLD
         if style.map_goal_pair:
-            goal_attr = curses.color_pair(style.map_goal_pair) | curses.A_BOLD
+            goal_attr = style.pair_attrs[style.map_goal_pair] | curses.A_BOLD
+
+    rows = _map_rows(grid, style, out_h, out_w, wall_attr, floor_attr)
 
     if style.unicode_ok:
         half_rows = out_h * 2
-        scale_x = map_w / out_w
-        scale_y = map_h / half_rows
-
         ox_p = int(px_i * out_w / map_w)
         oy_p = (int(py_i * half_rows / map_h)) // 2
-
         ox_g = int(gx * out_w / map_w)
         oy_g = (int(gy * half_rows / map_h)) // 2
-
         player_ch = player_dir_glyph(style, player.ang)
         goal_ch = "✚"
 
+        for oy, (row_chars, row_attrs) in enumerate(rows):
+            if oy == oy_g or oy == oy_p:
+                row_chars = list(row_chars)
+                row_attrs = list(row_attrs)
+                if oy == oy_g and ox_g < len(row_chars):
+                    row_chars[ox_g] = goal_ch
+                    row_attrs[ox_g] = goal_attr
+                if oy == oy_p and ox_p < len(row_chars):
+                    row_chars[ox_p] = player_ch
+                    row_attrs[ox_p] = player_attr
+            draw_row(stdscr, oy + header_lines, row_chars, row_attrs)
+    else:
+        ox_p = int(px_i * out_w / map_w)
+        oy_p = int(py_i * out_h / map_h)
+        ox_g = int(gx * out_w / map_w)
+        oy_g = int(gy * out_h / map_h)
+        player_ch = player_dir_glyph(style, player.ang)
+        goal_ch = "X"
+
+        for oy, row in enumerate(rows):
+            if oy == oy_g or oy == oy_p:
+                row = list(row)
+                if oy == oy_g and row[ox_g] != " ":
+                    row[ox_g] = goal_ch
+                if oy == oy_p and row[ox_p] != " ":
+                    row[ox_p] = player_ch
+                row = "".join(row)
+            safe_addstr(stdscr, oy + header_lines, 0, row)
+
+
+def _map_rows(
+    grid: list[str], style: Style, out_h: int, out_w: int, wall_attr: int, floor_attr: int
+) -> list:
+    """Return the maze part of every minimap row, without the markers.
+
+    Unicode maps get ``(chars, attrs)`` per row (two map rows per line as half
+    blocks); ASCII maps get one string per row. The result only depends on the
+    grid, the style and the output size, so it is kept until one of them
+    changes and a frame only overlays the goal and player markers.
+    """
+    global _map_rows_cache
+    cached = _map_rows_cache
+    if (
+        cached is not None
+        and cached[0] is grid
+        and cached[1] is style
+        and cached[2] == (out_h, out_w)
+    ):
+        return cached[3]
+
+    map_h = len(grid)
+    map_w = len(grid[0])
+    walls = wall_mask(grid)
+    scale_x = map_w / out_w
+    rows: list = []
+
+    if style.unicode_ok:
+        half_rows = out_h * 2
+        scale_y = map_h / half_rows
+
+        # Map column sampled by each output column (stopping at the map edge),
+        # and glyph/attr per code top_wall * 2 + bot_wall.
+        xs = [mx for mx in (int(x * scale_x) for x in range(out_w)) if mx < map_w]
+        if style.colors_ok:
+            glyphs = (" ", "▄", "▀", "█")
+            code_attrs = (floor_attr, wall_attr, wall_attr, wall_attr)
+        else:
+            glyphs = ("·", "▄", "▀", "█")
+            code_attrs = (curses.A_NORMAL, wall_attr, wall_attr, wall_attr)
+
         for oy in range(out_h):
             y_top = int((2 * oy) * scale_y)
             y_bot = int((2 * oy + 1) * scale_y)
@@ -98,92 +161,25 @@ def render_map(
                 break
             if y_bot >= map_h:
                 y_bot = map_h - 1
+            top_row = y_top * map_w
+            bot_row = y_bot * map_w
 
-            x = 0
-            while x < out_w:
-                mx = int(x * scale_x)
-                if mx >= map_w:
-                    break
-
-                top_wall = grid[y_top][mx] == WALL
-                bot_wall = grid[y_bot][mx] == WALL
-
-                if top_wall and bot_wall:
-                    ch = "█"
-                    attr = wall_attr
-                elif top_wall and not bot_wall:
-                    ch = "▀"
-                    attr = wall_attr
-                elif not top_wall and bot_wall:
-                    ch = "▄"
-                    attr = wall_attr
-                else:
-                    ch = " " if style.colors_ok else "·"
-                    attr = floor_attr if style.colors_ok else curses.A_NORMAL
-
-                if oy == oy_g and x == ox_g:
-                    ch = goal_ch
-                    attr = goal_attr
-                if oy == oy_p and x == ox_p:
-                    ch = player_ch
-                    attr = player_attr
-
-                start = x
-                buf = [ch]
-                x += 1
-                while x < out_w:
-                    mx2 = int(x * scale_x)
-                    if mx2 >= map_w:
-                        break
-                    top_wall2 = grid[y_top][mx2] == WALL
-                    bot_wall2 = grid[y_bot][mx2] == WALL
-                    if top_wall2 and bot_wall2:
-                        ch2 = "█"
-                        attr2 = wall_attr
-                    elif top_wall2 and not bot_wall2:
-                        ch2 = "▀"
-                        attr2 = wall_attr
-                    elif not top_wall2 and bot_wall2:
-                        ch2 = "▄"
-                        attr2 = wall_attr
-                    else:
-                        ch2 = " " if style.colors_ok else "·"
-                        attr2 = floor_attr if style.colors_ok else curses.A_NORMAL
-                    if oy == oy_g and x == ox_g:
-                        ch2 = goal_ch
-                        attr2 = goal_attr
-                    if oy == oy_p and x == ox_p:
-                        ch2 = player_ch
-                        attr2 = player_attr
-                    if attr2 != attr:
-                        break
-                    buf.append(ch2)
-                    x += 1
-                safe_addstr(stdscr, oy + header_lines, start, "".join(buf), attr)
+            codes = [walls[top_row + mx] * 2 + walls[bot_row + mx] for mx in xs]
+            rows.append(([glyphs[c] for c in codes], [code_attrs[c] for c in codes]))
     else:
-        scale_x = map_w / out_w
         scale_y = map_h / out_h
-        ox_p = int(px_i * out_w / map_w)
-        oy_p = int(py_i * out_h / map_h)
-        ox_g = int(gx * out_w / map_w)
-        oy_g = int(gy * out_h / map_h)
-        player_ch = player_dir_glyph(style, player.ang)
-        goal_ch = "X"
+
+        # Map column per output column; -1 past the map edge.
+        xs = [mx if mx < map_w else -1 for mx in (int(x * scale_x) for x in range(out_w))]
 
         for oy in range(out_h):
             my = int(oy * scale_y)
             if my >= map_h:
                 break
-            row = []
-            for ox in range(out_w):
-                mx = int(ox * scale_x)
-                if mx >= map_w:
-                    row.append(" ")
-                    continue
-                ch = "#" if grid[my][mx] == WALL else "."
-                if ox == ox_g and oy == oy_g:
-                    ch = goal_ch
-                if ox == ox_p and oy == oy_p:
-                    ch = player_ch
-                row.append(ch)
-            safe_addstr(stdscr, oy + header_lines, 0, "".join(row))
+            map_row = my * map_w
+            rows.append(
+                "".join(" " if mx < 0 else "#" if walls[map_row + mx] else "." for mx in xs)
+            )
+
+    _map_rows_cache = (grid, style, (out_h, out_w), rows)
+    return rows
@@ -0,0 +1,101 @@
+"""Double-buffered frame output with per-row damage tracking."""
+
+from __future__ import annotations
+
+import curses
+
+from .util import safe_addstr
+
+Run = tuple[int, str, int]  # (x, text, attr)
+
+
+class FrameBuffer:
+    """Stand-in for ``stdscr`` that records a frame and flushes only what changed.
+
+    Renderers draw through it exactly as they would draw to ``stdscr``
+    (``getmaxyx``/``erase``/``addstr``), but writes are recorded as runs per row
+    instead of reaching curses. :meth:`present` compares each row with the
+    previously presented frame: unchanged rows cost nothing, rows with the same
+    run layout only rewrite the runs that differ, and anything else is cleared
+    and rewritten from the first run that differs.
+
+    Anything that draws to the real screen behind the buffer's back (menus,
+    prompts, the win screen) must be followed by :meth:`invalidate`.
+    """
+
+    def __init__(self, stdscr) -> None:
+        self.stdscr = stdscr
+        self._rows: list[list[Run]] = []
+        self._prev: list[list[Run]] | None = None
+        self._size: tuple[int, int] = (0, 0)
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.stdscr.getmaxyx()
+
+    def erase(self) -> None:
+        h, _w = self.stdscr.getmaxyx()
+        self._rows = [[] for _ in range(h)]
+
+    def addstr(self, y: int, x: int, s: str, attr: int = 0) -> None:
+        if y < 0 or y >= len(self._rows) or x < 0:
+            raise curses.error("addstr() returned ERR")
+        self._rows[y].append((x, s, attr))
+
+    @property
+    def has_frame(self) -> bool:
+        """Whether a presented frame is on screen and has not been invalidated."""
+        return self._prev is not None
+
+    def invalidate(self) -> None:
+        """Forget the presented frame so the next :meth:`present` redraws fully."""
+        self._prev = None
+
+    def present(self) -> None:
+        stdscr = self.stdscr
+        size = stdscr.getmaxyx()
+        prev = self._prev
+        if prev is None or size != self._size:
+            stdscr.erase()
+            prev = []
+            self._size = size
+
+        for y, runs in enumerate(self._rows):
+            old = prev[y] if y < len(prev) else None
+            if runs == old:
+                continue
+            if old is not None and len(old) == len(runs):
+                same_layout = True
+                for (x0, s0, _a0), (x1, s1, _a1) in zip(old, runs):
+                    if x0 != x1 or len(s0) != len(s1):
+                        same_layout = False
+                        break
+                if same_layout:
+                    for run, old_run in zip(runs, old):
+                        if run != old_run:
+                            safe_addstr(stdscr, y, run[0], run[1], run[2])
+                    continue
+            # Keep the leading runs both frames share; clear and redraw the rest.
+            k = 0
+            clear_x = 0
+            if old is not None:
+                n = min(len(old), len(runs))
+                while k < n and old[k] == runs[k]:
+                    x, s, _attr = runs[k]
+                    if x < clear_x:
+                        break  # runs out of order: redraw from here
+                    clear_x = x + len(s)
+                    k += 1
+                if any(run[0] < clear_x for run in old[k:]):
+                    k = 0
+                    clear_x = 0
+                try:
+                    stdscr.move(y, clear_x)
+                    stdscr.clrtoeol()
+                except curses.error:
+                    pass
+            for x, s, attr in runs[k:]:
+                safe_addstr(stdscr, y, x, s, attr)
+
+        self._prev = self._rows
+        self._rows = []
+        stdscr.refresh()
@@ -6,17 +6,29 @@ import curses
 import locale
 import os
 import sys
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Literal
 
 from .constants import (
     ASCII_FLOOR_SHADES,
     ASCII_WALL_SHADES,
     MAX_RAY_DIST,
+    SHADE_LUT_SIZE,
     UNICODE_FLOOR_CHARS,
 )
 from .models import Settings
-from .util import clamp, safe_addstr
+from .util import safe_addstr
+
+# Multiply a distance by this to get its index into Style.wall_lut tables.
+DIST_LUT_SCALE = (SHADE_LUT_SIZE - 1) / MAX_RAY_DIST
+
+# Unicode shade glyphs by distance band: glyph i covers steps[i-1] <= d < steps[i].
+_WALL_TEXT_STEPS = (2.5, 5.5, 10.0)
+_WALL_TEXT_CHARS = "█▓▒░"
+_WALL_TOP_STEPS = (2.5, 6.0, 14.0)
+_WALL_TOP_CHARS = "▓▒░·"
 
 
 @dataclass
@@ -40,13 +52,70 @@ class Style:
     map_player_pair: int
     map_goal_pair: int
 
+    _floor_grad_luts: dict[int, tuple[tuple[str, ...], tuple[int, ...]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @cached_property
+    def pair_attrs(self) -> dict[int, int]:
+        """``curses.color_pair()`` of every color pair this style uses, by pair id."""
+        pids = (
+            *self.wall_pairs,
+            *self.floor_pairs,
+            self.hud_pair,
+            self.map_wall_pair,
+            self.map_floor_pair,
+            self.map_player_pair,
+            self.map_goal_pair,
+        )
+        return {pid: curses.color_pair(pid) for pid in pids if pid}
+
+    @cached_property
+    def wall_lut(self) -> tuple[tuple[str, ...], tuple[int, ...], tuple[int, ...]]:
+        """Wall char and side-0/side-1 attrs, precomputed per distance bucket.
+
+        Index with ``int(dist * DIST_LUT_SCALE)``. Renderers use this instead of
+        calling :meth:`wall_char_text`/:meth:`wall_attr` once per column.
+        """
+        chars: list[str] = []
+        attrs0: list[int] = []
+        attrs1: list[int] = []
+        for b in range(SHADE_LUT_SIZE):
+            d = min((b + 0.5) / DIST_LUT_SCALE, MAX_RAY_DIST)
+            chars.append(self.wall_char_text(d))
+            attrs0.append(self.wall_attr(d, 0))
+            attrs1.append(self.wall_attr(d, 1))
+        return tuple(chars), tuple(attrs0), tuple(attrs1)
+
+    def wall_shades(self, dists: list[float], sides: list[int]) -> tuple[list[str], list[int]]:
+        """Shaded wall char and attr of every column, looked up in :attr:`wall_lut`.
+
+        ``dists`` are fish-eye corrected distances no larger than ``MAX_RAY_DIST``.
+        """
+        lut_chars, attrs0, attrs1 = self.wall_lut
+        buckets = [int(d * DIST_LUT_SCALE) for d in dists]
+        return [lut_chars[b] for b in buckets], [
+            attrs1[b] if side else attrs0[b] for b, side in zip(buckets, sides)
+        ]
+
+    def floor_grad_lut(self, view_h: int) -> tuple[tuple[str, ...], tuple[int, ...]]:
+        """Floor gradient char/attr for every screen row, cached per view height."""
+        lut = self._floor_grad_luts.get(view_h)
+        if lut is None:
+            lut = (
+                tuple(self.floor_char_grad(y, view_h) for y in range(view_h)),
+                tuple(self.floor_attr_grad(y, view_h) for y in range(view_h)),
+            )
+            self._floor_grad_luts[view_h] = lut
+        return lut
+
     def wall_attr(self, dist: float, side: int) -> int:
         if not self.colors_ok or not self.wall_pairs:
             return curses.A_NORMAL
-        t = clamp(dist / MAX_RAY_DIST, 0.0, 1.0)
+        t = dist / MAX_RAY_DIST
+        t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
         idx = int(t * (len(self.wall_pairs) - 1))
-        pair = self.wall_pairs[idx]
-        attr = curses.color_pair(pair)
+        attr = self.pair_attrs[self.wall_pairs[idx]]
         if side == 1:
             attr |= curses.A_DIM
         if dist < 3.5:
@@ -56,58 +125,54 @@ class Style:
     def floor_attr_dist(self, dist: float) -> int:
         if not self.colors_ok or not self.floor_pairs:
             return curses.A_NORMAL
-        t = clamp(dist / MAX_RAY_DIST, 0.0, 1.0)
+        t = dist / MAX_RAY_DIST
+        t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
         idx = int(t * (len(self.floor_pairs) - 1))
-        return curses.color_pair(self.floor_pairs[idx])
+        return self.pair_attrs[self.floor_pairs[idx]]
 
     def floor_attr_grad(self, y: int, view_h: int) -> int:
         if not self.colors_ok or not self.floor_pairs:
             return curses.A_NORMAL
-        t = clamp((y - view_h * 0.5) / max(1.0, view_h * 0.5), 0.0, 1.0)
+        t = (y - view_h * 0.5) / max(1.0, view_h * 0.5)
+        t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
         idx = int(t * (len(self.floor_pairs) - 1))
-        return curses.color_pair(self.floor_pairs[idx])
+        return self.pair_attrs[self.floor_pairs[idx]]
 
     def wall_char_text(self, dist: float) -> str:
         if not self.unicode_ok:
-            t = clamp(dist / MAX_RAY_DIST, 0.0, 1.0)
+            t = dist / MAX_RAY_DIST
+            t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
             idx = int(t * (len(ASCII_WALL_SHADES) - 1))
             return ASCII_WALL_SHADES[idx]
-        if dist < 2.5:
-            return "█"
-        if dist < 5.5:
-            return "▓"
-        if dist < 10.0:
-            return "▒"
-        return "░"
+        return _WALL_TEXT_CHARS[bisect_right(_WALL_TEXT_STEPS, dist)]
 
     def wall_char_top(self, dist: float) -> str:
         if not self.unicode_ok:
-            t = clamp(dist / MAX_RAY_DIST, 0.0, 1.0)
+            t = dist / MAX_RAY_DIST
+            t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
             idx = int(t * (len(ASCII_WALL_SHADES) - 1))
             return ASCII_WALL_SHADES[idx]
-        if dist < 2.5:
-            return "▓"
-        if dist < 6.0:
-            return "▒"
-        if dist < 14.0:
-            return "░"
-        return "·"
+        return _WALL_TOP_CHARS[bisect_right(_WALL_TOP_STEPS, dist)]
 
     def floor_char_dist(self, dist: float) -> str:
         if not self.unicode_ok:
-            t = clamp(dist / MAX_RAY_DIST, 0.0, 1.0)
+            t = dist / MAX_RAY_DIST
+            t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
             idx = int(t * (len(ASCII_FLOOR_SHADES) - 1))
             return ASCII_FLOOR_SHADES[idx]
-        t = clamp(dist / MAX_RAY_DIST, 0.0, 1.0)
+        t = dist / MAX_RAY_DIST
+        t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
         idx = int(t * (len(UNICODE_FLOOR_CHARS) - 1))
         return UNICODE_FLOOR_CHARS[idx]
 
     def floor_char_grad(self, y: int, view_h: int) -> str:
         if not self.unicode_ok:
-            t = clamp((y - view_h * 0.5) / max(1.0, view_h * 0.5), 0.0, 1.0)
+            t = (y - view_h * 0.5) / max(1.0, view_h * 0.5)
+            t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
             idx = int(t * (len(ASCII_FLOOR_SHADES) - 1))
             return ASCII_FLOOR_SHADES[idx]
-        t = clamp((y - view_h * 0.5) / max(1.0, view_h * 0.5), 0.0, 1.0)
+        t = (y - view_h * 0.5) / max(1.0, view_h * 0.5)
+        t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
         idx = int(t * (len(UNICODE_FLOOR_CHARS) - 1))
         return UNICODE_FLOOR_CHARS[idx]
 
@@ -234,7 +299,24 @@ def init_style(stdscr) -> Style:
     )
 
 
+# effective_style() results by (id(base), unicode, colors); values are
+# (base, style). Reusing the Style keeps its LUTs warm across menu visits.
+_effective_style_cache: dict[tuple[int, str, str], tuple[Style, Style]] = {}
+
+
 def effective_style(base: Style, settings: Settings) -> Style:
+    key = (id(base), settings.unicode, settings.colors)
+    hit = _effective_style_cache.get(key)
+    if hit is not None and hit[0] is base:
+        return hit[1]
+    style = _build_effective_style(base, settings)
+    if len(_effective_style_cache) >= 16:
+        _effective_style_cache.clear()
+    _effective_style_cache[key] = (base, style)
+    return style
+
+
+def _build_effective_style(base: Style, settings: Settings) -> Style:
     unicode_ok = base.unicode_ok
     if settings.unicode == "on":
         unicode_ok = True
@@ -285,7 +367,7 @@ def prefer_utf8() -> bool:
 
 def flat_wall_attr(style: Style) -> int:
     if style.colors_ok and style.wall_pairs:
-        return curses.color_pair(style.wall_pairs[0]) | curses.A_BOLD
+        return style.pair_attrs[style.wall_pairs[0]] | curses.A_BOLD
     return curses.A_BOLD if style.unicode_ok else curses.A_NORMAL
 
 
@@ -295,14 +377,17 @@ def flat_floor_attr(style: Style) -> int:
             idx = len(style.floor_pairs) // 2
         else:
             idx = 0
-        return curses.color_pair(style.floor_pairs[idx])
+        return style.pair_attrs[style.floor_pairs[idx]]
     return curses.A_NORMAL
 
 
-def box_chars(unicode_ok: bool):
-    if unicode_ok:
-        return {"tl": "┌", "tr": "┐", "bl": "└", "br": "┘", "h": "─", "v": "│"}
-    return {"tl": "+", "tr": "+", "bl": "+", "br": "+", "h": "-", "v": "|"}
+_BOX_CHARS_UNICODE = {"tl": "┌", "tr": "┐", "bl": "└", "br": "┘", "h": "─", "v": "│"}
+_BOX_CHARS_ASCII = {"tl": "+", "tr": "+", "bl": "+", "br": "+", "h": "-", "v": "|"}
+
+
+def box_chars(unicode_ok: bool) -> dict[str, str]:
+    """Box-drawing characters by part; the shared dict must not be modified."""
+    return _BOX_CHARS_UNICODE if unicode_ok else _BOX_CHARS_ASCII
 
 
 def draw_box(stdscr, y: int, x: int, h: int, w: int, unicode_ok: bool, attr: int = 0) -> None:
@@ -35,7 +35,22 @@ def confirm_yes_no(stdscr, tr: Callable[[str], str], prompt_key: str) -> bool:
         stdscr.nodelay(True)
 
 
+# Last requested mouse tracking state and what it returned. Switching mouse
+# reporting writes escape sequences to the terminal, so a repeat request for
+# the current state is answered from here.
+_mouse_tracking: tuple[bool, bool] | None = None
+
+
 def set_mouse_tracking(enable: bool) -> bool:
+    global _mouse_tracking
+    if _mouse_tracking is not None and _mouse_tracking[0] == enable:
+        return _mouse_tracking[1]
+    active = _apply_mouse_tracking(enable)
+    _mouse_tracking = (enable, active)
+    return active
+
+
+def _apply_mouse_tracking(enable: bool) -> bool:
     try:
         if not enable:
             curses.mousemask(0)
@@ -53,14 +68,206 @@ def set_mouse_tracking(enable: bool) -> bool:
         return False
 
 
-def cycle_value(values: list[str], cur: str, delta: int) -> str:
-    try:
-        i = values.index(cur)
-    except ValueError:
-        i = 0
+def _menu_language_choices() -> tuple[str, ...]:
+    langs = list(LOCALES.keys())
+    if "en" in langs:
+        langs = ["en"] + [lang for lang in langs if lang != "en"]
+    return tuple(langs)
+
+
+# Values each "choice" menu item cycles through, keyed by Settings attribute.
+_MENU_CHOICES: dict[str, tuple[str, ...]] = {
+    "render_mode": ("auto", "text", "half", "braille"),
+    "shadows": ("on", "off"),
+    "colors": ("auto", "on", "off"),
+    "unicode": ("auto", "on", "off"),
+    "mouse_look": ("auto", "on", "off"),
+    "hud": ("auto5", "always", "off"),
+    "mode": ("default", "free", "demo_default", "demo_free"),
+    "language": _menu_language_choices(),
+}
+_MENU_CHOICE_INDEX: dict[str, dict[str, int]] = {
+    key: {v: i for i, v in enumerate(values)} for key, values in _MENU_CHOICES.items()
+}
+
+
+def cycle_value(
+    values: tuple[str, ...] | list[str],
+    cur: str,
+    delta: int,
+    index: dict[str, int] | None = None,
+) -> str:
+    """Step ``delta`` places from ``cur`` through ``values`` (wrapping).
+
+    Unknown values start from the first entry. Pass ``index`` (value -> position)
+    to avoid a linear search.
+    """
+    if index is not None:
+        i = index.get(cur, 0)
+    else:
+        try:
+            i = values.index(cur)
+        except ValueError:
+            i = 0
     return values[(i + delta) % len(values)]
 
 
+def _draw_menu(
+    stdscr,
+    base_style: Style,
+    caps: Capabilities,
+    settings: Settings,
+    tr: Callable[[str], str],
+    items: list[tuple[str, str, str]],
+    sel: int,
+) -> None:
+    stdscr.erase()
+    H, W = stdscr.getmaxyx()
+
+    box_w = min(94, W - 4)
+    box_h = min(30, H - 4)
+    box_x = (W - box_w) // 2
+    box_y = (H - box_h) // 2
+
+    unicode_ui = base_style.unicode_ok
+    border_attr = curses.A_NORMAL
+    if base_style.colors_ok and base_style.hud_pair:
+        border_attr |= base_style.pair_attrs[base_style.hud_pair]
+
+    draw_box(stdscr, box_y, box_x, box_h, box_w, unicode_ui, border_attr)
+    title = tr("menu_title")
+    safe_addstr(stdscr, box_y, box_x + 2, title[: box_w - 4], border_attr | curses.A_BOLD)
+
+    cap_parts = []
+    cap_parts.append(tr("cap_utf8_ok") if caps.unicode_ok else tr("cap_utf8_no"))
+    if caps.colors_ok and caps.color_mode == "256":
+        cap_parts.append(tr("cap_color_256"))
+    elif caps.colors_ok:
+        cap_parts.append(tr("cap_color"))
+    else:
+        cap_parts.append(tr("cap_mono"))
+    cap_parts.append(tr("cap_mouse_ok") if caps.mouse_motion_ok else tr("cap_mouse_no"))
+
+    caps_line = tr("menu_terminal", caps=", ".join(cap_parts))
+    safe_addstr(stdscr, box_y + 1, box_x + 2, caps_line[: box_w - 4], curses.A_DIM)
+
+    left_w = int(box_w * 0.56)
+    left_x = box_x + 2
+    right_x = left_x + left_w + 2
+    # Right panel width: keep one-char padding before the border to prevent curses auto-wrap.
+    text_right = box_x + box_w - 3
+    right_w = max(0, text_right - right_x + 1)
+    top_y = box_y + 3
+
+    sep = "│" if unicode_ui else "|"
+    for yy in range(top_y - 1, box_y + box_h - 2):
+        safe_addstr(stdscr, yy, right_x - 2, sep, border_attr)
+
+    list_h = box_y + box_h - 4 - top_y + 1
+    label_width = 12
+
+    for i, (label_key, kind, key) in enumerate(items):
+        y = top_y + i
+        if y >= top_y + list_h:
+            break
+        is_sel = i == sel
+        prefix = "▶ " if unicode_ui else "> "
+        pad = "  "
+        attr = curses.A_REVERSE if is_sel else curses.A_NORMAL
+
+        label = tr(label_key)
+
+        value = ""
+        warn = ""
+        if kind == "range":
+            if key == "difficulty":
+                value = f"[ {settings.difficulty:3d} ]"
+            elif key == "fov":
+                value = f"[ {settings.fov * 180.0 / math.pi:5.1f}° ]"
+        elif kind == "choice":
+            cur = str(getattr(settings, key))
+            disp = option_display(tr, key, cur)
+            value = f"[ {disp} ]"
+            if key == "mouse_look" and not caps.mouse_motion_ok and cur != "off":
+                warn = " " + tr("warn_mouse")
+
+        line = (prefix if is_sel else pad) + f"{label:<{label_width}} {value}{warn}"
+        safe_addstr(stdscr, y, left_x, line[:left_w], attr)
+
+    label_key, kind, key = items[sel]
+    label = tr(label_key)
+    help_lines = [
+        tr("help_selected", label=label),
+        "",
+        tr("help_nav_title"),
+        tr("help_nav_updown"),
+        tr("help_nav_leftright"),
+        tr("help_nav_enter"),
+        tr("help_nav_esc"),
+        "",
+        tr("help_in_game"),
+        "",
+    ]
+
+    if key == "render_mode":
+        help_lines += [
+            tr("help_render_title"),
+            tr("help_render_text"),
+            tr("help_render_half"),
+            tr("help_render_braille"),
+            tr("help_render_auto"),
+        ]
+    elif key == "hud":
+        help_lines += [
+            tr("help_hud_title"),
+            tr("help_hud_auto5"),
+            tr("help_hud_always"),
+            tr("help_hud_off"),
+        ]
+    elif key == "mouse_look":
+        help_lines += [
+            tr("help_mouse_title"),
+            tr("help_mouse_desc1"),
+            tr("help_mouse_desc2"),
+        ]
+    elif key == "mode":
+        help_lines += [
+            tr("help_mode_title"),
+            tr("help_mode_default"),
+            tr("help_mode_free"),
+            tr("help_mode_demo_default"),
+            tr("help_mode_demo_free"),
+        ]
+    elif key == "shadows":
+        help_lines += [
+            tr("help_shadows_title"),
+            tr("help_shadows_on"),
+            tr("help_shadows_off"),
+        ]
+
+    # Wrap help text so it never draws outside the frame.
+    yy = top_y
+    for i, line in enumerate(help_lines):
+        if yy >= box_y + box_h - 2:
+            break
+        base_attr = curses.A_BOLD if i == 0 else curses.A_DIM
+        if not line:
+            yy += 1
+            continue
+        # textwrap.wrap ensures long lines are wrapped within right_w.
+        for seg in textwrap.wrap(
+            line, width=max(1, right_w), break_long_words=True, break_on_hyphens=True
+        ):
+            if yy >= box_y + box_h - 2:
+                break
+            safe_addstr(stdscr, yy, right_x, seg, base_attr)
+            yy += 1
+
+    footer = tr("menu_footer")
+    safe_addstr(stdscr, box_y + box_h - 2, box_x + 2, footer[: box_w - 4], curses.A_DIM)
+    stdscr.refresh()
+
+
 def run_menu(
     stdscr,
     base_style: Style,
@@ -71,16 +278,6 @@ def run_menu(
     stdscr.nodelay(False)
     sel = 0
 
-    render_choices = ["auto", "text", "half", "braille"]
-    onoff = ["on", "off"]
-    onoffauto = ["auto", "on", "off"]
-    hud_choices = ["auto5", "always", "off"]
-    mode_choices = ["default", "free", "demo_default", "demo_free"]
-
-    lang_choices = list(LOCALES.keys())
-    if "en" in lang_choices:
-        lang_choices = ["en"] + [lang for lang in lang_choices if lang != "en"]
-
     items: list[tuple[str, str, str]] = []
     if mode == "pause":
         items.append(("menu_action_resume", "action", "resume"))
@@ -104,13 +301,16 @@ def run_menu(
         items.append(("menu_action_restart", "action", "restart"))
     items.append(("menu_action_quit", "action", "quit"))
 
+    # Last drawn (size, selection, settings); None forces a redraw.
+    drawn_key: tuple | None = None
     while True:
         tr = make_tr(settings.language)
 
-        stdscr.erase()
         H, W = stdscr.getmaxyx()
 
         if H < 14 or W < 44:
+            drawn_key = None
+            stdscr.erase()
             safe_addstr(stdscr, 0, 0, tr("menu_small"))
             safe_addstr(stdscr, 2, 0, tr("menu_small_hint"))
             stdscr.refresh()
@@ -124,151 +324,19 @@ def run_menu(
                 return "resume" if mode == "pause" else "start"
             continue
 
-        box_w = min(94, W - 4)
-        box_h = min(30, H - 4)
-        box_x = (W - box_w) // 2
-        box_y = (H - box_h) // 2
-
-        unicode_ui = base_style.unicode_ok
-        border_attr = curses.A_NORMAL
-        if base_style.colors_ok and base_style.hud_pair:
-            border_attr |= curses.color_pair(base_style.hud_pair)
-
-        draw_box(stdscr, box_y, box_x, box_h, box_w, unicode_ui, border_attr)
-        title = tr("menu_title")
-        safe_addstr(stdscr, box_y, box_x + 2, title[: box_w - 4], border_attr | curses.A_BOLD)
-
-        cap_parts = []
-        cap_parts.append(tr("cap_utf8_ok") if caps.unicode_ok else tr("cap_utf8_no"))
-        if caps.colors_ok and caps.color_mode == "256":
-            cap_parts.append(tr("cap_color_256"))
-        elif caps.colors_ok:
-            cap_parts.append(tr("cap_color"))
-        else:
-            cap_parts.append(tr("cap_mono"))
-        cap_parts.append(tr("cap_mouse_ok") if caps.mouse_motion_ok else tr("cap_mouse_no"))
-
-        caps_line = tr("menu_terminal", caps=", ".join(cap_parts))
-        safe_addstr(stdscr, box_y + 1, box_x + 2, caps_line[: box_w - 4], curses.A_DIM)
-
-        left_w = int(box_w * 0.56)
-        left_x = box_x + 2
-        right_x = left_x + left_w + 2
-        # Right panel width: keep one-char padding before the border to prevent curses auto-wrap.
-        text_right = box_x + box_w - 3
-        right_w = max(0, text_right - right_x + 1)
-        top_y = box_y + 3
-
-        sep = "│" if unicode_ui else "|"
-        for yy in range(top_y - 1, box_y + box_h - 2):
-            safe_addstr(stdscr, yy, right_x - 2, sep, border_attr)
-
-        list_h = box_y + box_h - 4 - top_y + 1
         sel = max(0, min(sel, len(items) - 1))
+        # The menu only changes with the terminal size, selection or settings;
+        # skip the full redraw when a keypress left all of them untouched.
+        state_key = (
+            H,
+            W,
+            sel,
+            tuple(getattr(settings, key) for _label, kind, key in items if kind != "action"),
+        )
+        if state_key != drawn_key:
+            _draw_menu(stdscr, base_style, caps, settings, tr, items, sel)
+            drawn_key = state_key
 
-        label_width = 12
-
-        for i, (label_key, kind, key) in enumerate(items):
-            y = top_y + i
-            if y >= top_y + list_h:
-                break
-            is_sel = i == sel
-            prefix = "▶ " if unicode_ui else "> "
-            pad = "  "
-            attr = curses.A_REVERSE if is_sel else curses.A_NORMAL
-
-            label = tr(label_key)
-
-            value = ""
-            warn = ""
-            if kind == "range":
-                if key == "difficulty":
-                    value = f"[ {settings.difficulty:3d} ]"
-                elif key == "fov":
-                    value = f"[ {settings.fov * 180.0 / math.pi:5.1f}° ]"
-            elif kind == "choice":
-                cur = str(getattr(settings, key))
-                disp = option_display(tr, key, cur)
-                value = f"[ {disp} ]"
-                if key == "mouse_look" and not caps.mouse_motion_ok and cur != "off":
-                    warn = " " + tr("warn_mouse")
-
-            line = (prefix if is_sel else pad) + f"{label:<{label_width}} {value}{warn}"
-            safe_addstr(stdscr, y, left_x, line[:left_w], attr)
-
-        label_key, kind, key = items[sel]
-        label = tr(label_key)
-        help_lines = [
-            tr("help_selected", label=label),
-            "",
-            tr("help_nav_title"),
-            tr("help_nav_updown"),
-            tr("help_nav_leftright"),
-            tr("help_nav_enter"),
-            tr("help_nav_esc"),
-            "",
-            tr("help_in_game"),
-            "",
-        ]
-
-        if key == "render_mode":
-            help_lines += [
-                tr("help_render_title"),
-                tr("help_render_text"),
-                tr("help_render_half"),
-                tr("help_render_braille"),
-                tr("help_render_auto"),
-            ]
-        elif key == "hud":
-            help_lines += [
-                tr("help_hud_title"),
-                tr("help_hud_auto5"),
-                tr("help_hud_always"),
-                tr("help_hud_off"),
-            ]
-        elif key == "mouse_look":
-            help_lines += [
-                tr("help_mouse_title"),
-                tr("help_mouse_desc1"),
-                tr("help_mouse_desc2"),
-            ]
-        elif key == "mode":
-            help_lines += [
-                tr("help_mode_title"),
-                tr("help_mode_default"),
-                tr("help_mode_free"),
-                tr("help_mode_demo_default"),
-                tr("help_mode_demo_free"),
-            ]
-        elif key == "shadows":
-            help_lines += [
-                tr("help_shadows_title"),
-                tr("help_shadows_on"),
-                tr("help_shadows_off"),
-            ]
-
-        # Wrap help text so it never draws outside the frame.
-        yy = top_y
-        for i, line in enumerate(help_lines):
-            if yy >= box_y + box_h - 2:
-                break
-            base_attr = curses.A_BOLD if i == 0 else curses.A_DIM
-            if not line:
-                yy += 1
-                continue
-            # textwrap.wrap ensures long lines are wrapped within right_w.
-            for seg in textwrap.wrap(
-                line, width=max(1, right_w), break_long_words=True, break_on_hyphens=True
-            ):
-                if yy >= box_y + box_h - 2:
-                    break
-                safe_addstr(stdscr, yy, right_x, seg, base_attr)
-                yy += 1
-
-        footer = tr("menu_footer")
-        safe_addstr(stdscr, box_y + box_h - 2, box_x + 2, footer[: box_w - 4], curses.A_DIM)
-
-        stdscr.refresh()
         ch = stdscr.getch()
 
         if ch == 27:  # ESC
@@ -276,6 +344,7 @@ def run_menu(
                 if confirm_yes_no(stdscr, tr, "prompt_exit"):
                     stdscr.nodelay(True)
                     return "quit"
+                drawn_key = None
                 continue
             stdscr.nodelay(True)
             return "resume"
@@ -296,18 +365,8 @@ def run_menu(
                     settings.fov = clamp(settings.fov + math.radians(2.0) * delta, FOV_MIN, FOV_MAX)
             elif kind == "choice":
                 cur = str(getattr(settings, key))
-                if key == "render_mode":
-                    settings.render_mode = cycle_value(render_choices, cur, delta)  # type: ignore
-                elif key == "shadows":
-                    settings.shadows = cycle_value(onoff, cur, delta)  # type: ignore
-                elif key in ("colors", "unicode", "mouse_look"):
-                    setattr(settings, key, cycle_value(onoffauto, cur, delta))
-                elif key == "hud":
-                    settings.hud = cycle_value(hud_choices, cur, delta)  # type: ignore
-                elif key == "mode":
-                    settings.mode = cycle_value(mode_choices, cur, delta)  # type: ignore
-                elif key == "language":
-                    settings.language = cycle_value(lang_choices, cur, delta)
+                new = cycle_value(_MENU_CHOICES[key], cur, delta, _MENU_CHOICE_INDEX[key])
+                setattr(settings, key, new)
 
         if ch in (curses.KEY_LEFT, ord("a"), ord("A")):
             adjust(-1)
@@ -323,6 +382,7 @@ def run_menu(
                     if confirm_yes_no(stdscr, tr, "prompt_exit"):
                         stdscr.nodelay(True)
                         return "quit"
+                    drawn_key = None
                     continue
                 stdscr.nodelay(True)
                 return key
@@ -334,6 +394,7 @@ def run_menu(
             if confirm_yes_no(stdscr, tr, "prompt_exit"):
                 stdscr.nodelay(True)
                 return "quit"
+            drawn_key = None
 
 
 def win_screen(stdscr, tr: Callable[[str], str], seconds: float, wait: bool) -> None:
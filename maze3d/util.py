@@ -18,8 +18,10 @@ def clamp(v: float, lo: float, hi: float) -> float:
 
 
 def normalize_angle(a: float) -> float:
-    while a < -math.pi:
-        a += 2 * math.pi
-    while a > math.pi:
-        a -= 2 * math.pi
-    return a
+    """Wrap an angle into ``[-pi, pi)`` in constant time.
+
+    ``math.remainder`` is exact and lands in ``[-pi, pi]``; only an exact ``pi``
+    needs folding onto ``-pi``.
+    """
+    r = math.remainder(a, math.tau)
+    return -math.pi if r == math.pi else r
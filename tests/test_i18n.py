@@ -0,0 +1,25 @@
+from maze3d.i18n import make_tr, option_display
+
+
+def test_make_tr_returns_one_translator_per_language() -> None:
+    assert make_tr("en") is make_tr("en")
+    assert make_tr("en") is not make_tr("ru")
+
+
+def test_tr_falls_back_to_english_then_to_the_key() -> None:
+    en = make_tr("en")
+    unknown = make_tr("xx")
+
+    assert unknown("menu_title") == en("menu_title")
+    assert en("no_such_key") == "no_such_key"
+    assert en("win_time", sec=1.25) == "Time: 1.2s"
+
+
+def test_option_display_translates_values_and_language_names() -> None:
+    en = make_tr("en")
+    ru = make_tr("ru")
+
+    assert option_display(en, "render_mode", "half") == en("opt_half")
+    assert option_display(ru, "render_mode", "half") == ru("opt_half")
+    assert option_display(en, "language", "ru") == ru("lang_name")
+    assert option_display(en, "difficulty", "42") == "42"
@@ -1,7 +1,15 @@
 import random
 
 from maze3d.constants import FREE_MAX_Z, OPEN, WALL, WALL_HEIGHT
-from maze3d.maze import find_path_cells, generate_maze, resolve_floor_collision
+from maze3d.maze import (
+    bordered_wall_mask,
+    find_path_cells,
+    generate_maze,
+    goal_distances,
+    is_wall,
+    resolve_floor_collision,
+    wall_mask,
+)
 from maze3d.models import Player
 
 
@@ -24,6 +32,19 @@ def test_generate_maze_dimensions_and_borders() -> None:
     assert any(OPEN in row for row in grid)
 
 
+def test_generate_maze_is_a_spanning_tree_of_cells() -> None:
+    cell_w, cell_h = 7, 5
+    grid = generate_maze(cell_w, cell_h, random.Random(3))
+
+    cells = [(2 * cx + 1, 2 * cy + 1) for cy in range(cell_h) for cx in range(cell_w)]
+    assert all(grid[y][x] == OPEN for x, y in cells)
+    open_count = sum(row.count(OPEN) for row in grid)
+    # A perfect maze opens every cell plus exactly cells - 1 connecting walls.
+    assert open_count == 2 * len(cells) - 1
+    for x, y in cells:
+        assert find_path_cells(grid, (1, 1), (x, y))[-1] == (x, y)
+
+
 def test_find_path_cells_returns_adjacent_open_steps() -> None:
     grid = [
         "#####",
@@ -67,3 +88,55 @@ def test_resolve_floor_collision_clamps_to_floor_and_ceiling() -> None:
     resolve_floor_collision(grid, p2)
     assert p2.z == FREE_MAX_Z
     assert p2.vz == 0.0
+
+
+def test_wall_mask_mirrors_grid_and_is_cached() -> None:
+    grid = generate_maze(3, 3, random.Random(1))
+    width = len(grid[0])
+
+    mask = wall_mask(grid)
+
+    assert mask is wall_mask(grid)
+    assert len(mask) == width * len(grid)
+    for y, row in enumerate(grid):
+        assert list(mask[y * width : (y + 1) * width]) == [1 if ch == WALL else 0 for ch in row]
+        for x in range(len(row)):
+            assert is_wall(grid, x, y) == (row[x] == WALL)
+    assert is_wall(grid, -1, 0)
+    assert is_wall(grid, 0, len(grid))
+
+
+def test_find_path_cells_unreachable_goal_returns_start() -> None:
+    grid = [
+        "#####",
+        "# # #",
+        "#####",
+    ]
+
+    assert find_path_cells(grid, (1, 1), (3, 1)) == [(1, 1)]
+    assert find_path_cells(grid, (1, 1), (1, 1)) == [(1, 1)]
+
+
+def test_goal_distances_match_shortest_paths() -> None:
+    grid = generate_maze(5, 4, random.Random(2))
+    width = len(grid[0])
+    goal = (9, 7)
+
+    dist = goal_distances(grid, goal)
+
+    assert dist[goal[1] * width + goal[0]] == 0
+    for y, row in enumerate(grid):
+        for x, ch in enumerate(row):
+            if ch == WALL:
+                assert dist[y * width + x] == -1
+            else:
+                assert dist[y * width + x] == len(find_path_cells(grid, (x, y), goal)) - 1
+
+
+def test_bordered_wall_mask_rings_the_wall_mask() -> None:
+    grid = ["# ", "  "]
+
+    mask = bordered_wall_mask(grid)
+
+    assert mask is bordered_wall_mask(grid)
+    assert list(mask) == [2, 2, 2, 2, 2, 1, 0, 2, 2, 0, 0, 2, 2, 2, 2, 2]
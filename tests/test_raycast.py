@@ -1,6 +1,22 @@
+import math
+import random
+
 import pytest
 
-from maze3d.raycast import cast_ray, compute_wall_span, floorcast_sample_row
+from maze3d.constants import MAX_RAY_DIST
+from maze3d.maze import generate_maze
+from maze3d.raycast import (
+    cast_ray,
+    cast_rays,
+    cast_view,
+    column_rays,
+    compute_wall_span,
+    floor_plane_numerators,
+    floorcast_row,
+    floorcast_sample_row,
+    view_dirs,
+    wall_spans,
+)
 from maze3d.style import Style
 
 
@@ -31,11 +47,84 @@ def test_cast_ray_hits_expected_wall_distance() -> None:
     assert side in (0, 1)
 
 
+def test_cast_rays_matches_room_geometry() -> None:
+    grid = [
+        "###",
+        "# #",
+        "###",
+    ]
+    angs = [i * (2 * math.pi / 64) - math.pi for i in range(64)]
+
+    dists, sides = cast_rays(
+        grid, 1.5, 1.5, [math.cos(a) for a in angs], [math.sin(a) for a in angs]
+    )
+
+    for a, dist, side in zip(angs, dists, sides):
+        expected = 0.5 / max(abs(math.cos(a)), abs(math.sin(a)))
+        assert dist == pytest.approx(expected, abs=1e-9)
+        assert side == (0 if abs(math.cos(a)) > abs(math.sin(a)) else 1)
+        assert (dist, side) == cast_ray(grid, 1.5, 1.5, a)
+
+
+def test_cast_rays_stops_at_open_map_edge() -> None:
+    grid = generate_maze(4, 4, random.Random(3))
+    grid[1] = " " * len(grid[1])  # open corridor leaking out of the map
+
+    dists, sides = cast_rays(grid, 1.5, 1.5, [1.0, -1.0], [0.0, 0.0])
+
+    assert dists == [MAX_RAY_DIST, MAX_RAY_DIST]
+    assert sides == [0, 0]
+
+
+def test_column_rays_span_fov_symmetrically() -> None:
+    fov = math.pi / 3.0
+    offsets, fish = column_rays(fov, 5)
+
+    assert offsets[0] == pytest.approx(-fov / 2.0)
+    assert offsets[2] == pytest.approx(0.0)
+    assert offsets[-1] == pytest.approx(fov / 2.0)
+    assert fish == tuple(math.cos(off) for off in offsets)
+    assert column_rays(fov, 5) is column_rays(fov, 5)
+
+
+def test_view_dirs_rotate_column_offsets_by_view_angle() -> None:
+    fov = 1.2
+    offsets, _fish = column_rays(fov, 9)
+
+    for ang in (0.0, 0.4, -2.9, math.pi):
+        cos_arr, sin_arr = view_dirs(ang, fov, 9)
+        assert cos_arr == pytest.approx([math.cos(ang + off) for off in offsets], abs=1e-12)
+        assert sin_arr == pytest.approx([math.sin(ang + off) for off in offsets], abs=1e-12)
+
+
+def test_cast_view_matches_cast_rays_and_reuses_results() -> None:
+    grid = generate_maze(6, 5, random.Random(2))
+
+    cos_arr, sin_arr, dists, sides = cast_view(grid, 1.5, 1.5, 0.4, 1.2, 31)
+
+    assert (cos_arr, sin_arr) == view_dirs(0.4, 1.2, 31)
+    assert (dists, sides) == cast_rays(grid, 1.5, 1.5, cos_arr, sin_arr)
+    assert cast_view(grid, 1.5, 1.5, 0.4, 1.2, 31)[2] is dists
+    assert cast_view(list(grid), 1.5, 1.5, 0.4, 1.2, 31)[2] is not dists
+
+
 def test_compute_wall_span_orders_top_and_bottom() -> None:
     top, bot = compute_wall_span(height=40, dist=2.0, cam_z=0.0, mid=20.0)
     assert top <= bot
 
 
+def test_wall_spans_matches_compute_wall_span() -> None:
+    dists = [0.0, 0.5, 1.3, 4.0, MAX_RAY_DIST]
+    _offsets, fish = column_rays(1.2, len(dists))
+
+    corrected, tops, bots = wall_spans(40, dists, fish, 0.9, 18.5)
+
+    for i, raw in enumerate(dists):
+        dist = max(0.0001, raw * fish[i])
+        assert corrected[i] == dist
+        assert (tops[i], bots[i]) == compute_wall_span(40, dist, 0.9, 18.5)
+
+
 def test_floorcast_sample_row_flat_mode_wraps_inside_grid() -> None:
     grid = [
         "###",
@@ -67,3 +156,19 @@ def test_floorcast_sample_row_flat_mode_wraps_inside_grid() -> None:
     # Attrs should be integers (curses attributes).
     assert isinstance(floor_attr, int)
     assert isinstance(top_attr, int)
+
+
+def test_floorcast_row_skips_rows_at_or_above_horizon() -> None:
+    grid = ["###", "# #", "###"]
+    style = dummy_style()
+    num_floor, num_top = floor_plane_numerators(2.0, 10.0)
+    assert (num_floor, num_top) == (20.0, 10.0)
+    assert floor_plane_numerators(0.5, 10.0)[1] is None
+    args = (grid, 1.5, 1.5, [1.0, 0.0], [0.0, 1.0], num_floor, num_top)
+
+    assert floorcast_row(*args, 0.0, style, False) is None
+    assert floorcast_row(*args, -3.0, style, False) is None
+
+    hit_top, *_ = floorcast_row(*args, 10.0, style, False)
+    # The wall-top plane is 1.0 away, which lands on the border walls.
+    assert hit_top == [True, True]
@@ -0,0 +1,17 @@
+from maze3d.render_common import draw_row
+
+
+class RecordingScreen:
+    def __init__(self) -> None:
+        self.writes: list[tuple[int, int, str, int]] = []
+
+    def addstr(self, y: int, x: int, s: str, attr: int = 0) -> None:
+        self.writes.append((y, x, s, attr))
+
+
+def test_draw_row_emits_one_write_per_attribute_run() -> None:
+    screen = RecordingScreen()
+
+    draw_row(screen, 3, list("  ##..."), [0, 0, 5, 5, 7, 7, 7])
+
+    assert screen.writes == [(3, 0, "  ", 0), (3, 2, "##", 5), (3, 4, "...", 7)]
@@ -0,0 +1,72 @@
+import math
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from maze3d import render_map as render_map_module
+from maze3d.i18n import make_tr
+from maze3d.maze import generate_maze
+from maze3d.models import Player, Settings
+from maze3d.render_map import player_dir_glyph, render_map
+from maze3d.style import Style
+
+
+class RecordingScreen:
+    def __init__(self) -> None:
+        self.writes: list[tuple] = []
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return (20, 50)
+
+    def addstr(self, *args) -> None:
+        self.writes.append(args)
+
+
+@pytest.mark.parametrize(
+    ("ang", "uni", "ascii_"),
+    [
+        (0.0, "►", ">"),
+        (math.pi / 2, "▼", "v"),
+        (math.pi, "◄", "<"),
+        (-math.pi / 2, "▲", "^"),
+        (math.pi / 4, "▼", "v"),
+        (-math.pi / 4, "►", ">"),
+        (2 * math.pi + 0.1, "►", ">"),
+    ],
+)
+def test_player_dir_glyph_quadrants(ang: float, uni: str, ascii_: str) -> None:
+    assert player_dir_glyph(SimpleNamespace(unicode_ok=True), ang) == uni
+    assert player_dir_glyph(SimpleNamespace(unicode_ok=False), ang) == ascii_
+
+
+@pytest.mark.parametrize("unicode_ok", [True, False])
+def test_render_map_cached_rows_do_not_keep_markers(monkeypatch, unicode_ok: bool) -> None:
+    grid = generate_maze(6, 5, random.Random(4))
+    style = Style(
+        unicode_ok=unicode_ok,
+        colors_ok=False,
+        color_mode="none",
+        wall_pairs=[],
+        floor_pairs=[],
+        hud_pair=0,
+        map_wall_pair=0,
+        map_floor_pair=0,
+        map_player_pair=0,
+        map_goal_pair=0,
+    )
+    tr = make_tr("en")
+    settings = Settings()
+
+    def draw(player: Player) -> list[tuple]:
+        screen = RecordingScreen()
+        render_map(screen, tr, grid, player, (11, 9), settings, style)
+        return screen.writes
+
+    monkeypatch.setattr(render_map_module, "_map_rows_cache", None)
+    draw(Player(x=1.5, y=1.5, z=0.0, ang=0.0))
+    moved = Player(x=7.5, y=5.5, z=0.0, ang=1.0)
+    cached = draw(moved)
+
+    monkeypatch.setattr(render_map_module, "_map_rows_cache", None)
+    assert cached == draw(moved)
@@ -0,0 +1,101 @@
+from maze3d.screen import FrameBuffer
+
+
+class FakeScreen:
+    """Minimal ``stdscr`` double that records cells and addstr calls."""
+
+    def __init__(self, h: int = 4, w: int = 20) -> None:
+        self.h = h
+        self.w = w
+        self.cells: dict[tuple[int, int], tuple[str, int]] = {}
+        self.writes: list[tuple[int, int, str, int]] = []
+        self._cursor = (0, 0)
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.h, self.w
+
+    def erase(self) -> None:
+        self.cells.clear()
+
+    def move(self, y: int, x: int) -> None:
+        self._cursor = (y, x)
+
+    def clrtoeol(self) -> None:
+        y, x = self._cursor
+        for xx in range(x, self.w):
+            self.cells.pop((y, xx), None)
+
+    def addstr(self, y: int, x: int, s: str, attr: int = 0) -> None:
+        self.writes.append((y, x, s, attr))
+        for i, ch in enumerate(s):
+            self.cells[(y, x + i)] = (ch, attr)
+
+    def refresh(self) -> None:
+        pass
+
+    def row(self, y: int) -> str:
+        return "".join(self.cells.get((y, x), (" ", 0))[0] for x in range(self.w)).rstrip()
+
+
+def draw(frame: FrameBuffer, rows: list[list[tuple[int, str, int]]]) -> None:
+    frame.erase()
+    for y, runs in enumerate(rows):
+        for x, s, attr in runs:
+            frame.addstr(y, x, s, attr)
+    frame.present()
+
+
+def test_present_skips_unchanged_rows_and_runs() -> None:
+    screen = FakeScreen()
+    frame = FrameBuffer(screen)
+    rows = [[(0, "abc", 1), (3, "def", 2)], [(0, "hud", 0)]]
+
+    draw(frame, rows)
+    assert screen.row(0) == "abcdef"
+    assert screen.row(1) == "hud"
+
+    screen.writes.clear()
+    draw(frame, rows)
+    assert screen.writes == []
+
+    draw(frame, [[(0, "abc", 1), (3, "xyz", 2)], [(0, "hud", 0)]])
+    assert screen.writes == [(0, 3, "xyz", 2)]
+    assert screen.row(0) == "abcxyz"
+
+
+def test_present_rewrites_row_when_layout_changes() -> None:
+    screen = FakeScreen()
+    frame = FrameBuffer(screen)
+
+    draw(frame, [[(0, "long line", 0)]])
+    draw(frame, [[(0, "ab", 1)]])
+
+    assert screen.row(0) == "ab"
+
+
+def test_present_keeps_shared_leading_runs_when_layout_changes() -> None:
+    screen = FakeScreen()
+    frame = FrameBuffer(screen)
+
+    draw(frame, [[(0, "abc", 1), (3, "def", 2), (6, "gh", 3)]])
+    screen.writes.clear()
+    draw(frame, [[(0, "abc", 1), (3, "d", 2), (4, "x", 4)]])
+
+    assert screen.writes == [(0, 3, "d", 2), (0, 4, "x", 4)]
+    assert screen.row(0) == "abcdx"
+
+
+def test_invalidate_forces_full_redraw() -> None:
+    screen = FakeScreen()
+    frame = FrameBuffer(screen)
+    rows = [[(0, "abc", 1)]]
+
+    assert not frame.has_frame
+    draw(frame, rows)
+    assert frame.has_frame
+    screen.erase()  # something else drew over the screen
+    frame.invalidate()
+    assert not frame.has_frame
+    draw(frame, rows)
+
+    assert screen.row(0) == "abc"
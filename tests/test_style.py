@@ -0,0 +1,63 @@
+import pytest
+
+from maze3d.models import Settings
+from maze3d.style import Style, effective_style
+
+
+def make_style(unicode_ok: bool = True) -> Style:
+    return Style(
+        unicode_ok=unicode_ok,
+        colors_ok=False,
+        color_mode="none",
+        wall_pairs=[],
+        floor_pairs=[],
+        hud_pair=0,
+        map_wall_pair=0,
+        map_floor_pair=0,
+        map_player_pair=0,
+        map_goal_pair=0,
+    )
+
+
+@pytest.mark.parametrize(
+    ("dist", "text", "top"),
+    [
+        (0.0, "█", "▓"),
+        (2.49, "█", "▓"),
+        (2.5, "▓", "▒"),
+        (5.5, "▒", "▒"),
+        (6.0, "▒", "░"),
+        (10.0, "░", "░"),
+        (14.0, "░", "·"),
+        (99.0, "░", "·"),
+    ],
+)
+def test_unicode_wall_chars_follow_distance_bands(dist: float, text: str, top: str) -> None:
+    style = make_style()
+
+    assert style.wall_char_text(dist) == text
+    assert style.wall_char_top(dist) == top
+
+
+def test_effective_style_reuses_style_for_same_settings() -> None:
+    base = make_style()
+    settings = Settings()
+
+    style = effective_style(base, settings)
+
+    assert effective_style(base, Settings()) is style
+    settings.unicode = "off"
+    ascii_style = effective_style(base, settings)
+    assert ascii_style is not style
+    assert not ascii_style.unicode_ok
+    assert effective_style(make_style(), Settings()) is not style
+
+
+def test_wall_shades_match_per_column_lookups() -> None:
+    style = make_style()
+    dists = [0.5, 4.0, 12.0]
+
+    chars, attrs = style.wall_shades(dists, [0, 1, 0])
+
+    assert chars == [style.wall_char_text(d) for d in dists]
+    assert attrs == [style.wall_attr(0.5, 0), style.wall_attr(4.0, 1), style.wall_attr(12.0, 0)]
@@ -0,0 +1,33 @@
+from maze3d import ui
+from maze3d.ui import cycle_value
+
+
+def test_cycle_value_wraps_and_defaults_to_first_entry() -> None:
+    values = ("auto", "on", "off")
+    index = {v: i for i, v in enumerate(values)}
+
+    for idx in (None, index):
+        assert cycle_value(values, "auto", 1, idx) == "on"
+        assert cycle_value(values, "off", 1, idx) == "auto"
+        assert cycle_value(values, "auto", -1, idx) == "off"
+        assert cycle_value(values, "bogus", 1, idx) == "on"
+
+
+def test_set_mouse_tracking_only_switches_on_change(monkeypatch) -> None:
+    calls = []
+
+    def mousemask(mask):
+        calls.append(mask)
+        return mask, 0
+
+    monkeypatch.setattr(ui, "_mouse_tracking", None)
+    monkeypatch.setattr(ui.curses, "mousemask", mousemask)
+    monkeypatch.setattr(ui.curses, "mouseinterval", lambda interval: 0, raising=False)
+
+    assert not ui.set_mouse_tracking(False)
+    assert not ui.set_mouse_tracking(False)
+    assert len(calls) == 1
+
+    active = ui.set_mouse_tracking(True)
+    assert ui.set_mouse_tracking(True) == active
+    assert len(calls) == (2 if hasattr(ui.curses, "REPORT_MOUSE_POSITION") else 1)
@@ -0,0 +1,40 @@
+import math
+
+import pytest
+
+from maze3d.util import clamp, normalize_angle
+
+
+@pytest.mark.parametrize(
+    "a",
+    [
+        0.0,
+        0.5,
+        -0.5,
+        math.pi - 1e-9,
+        math.pi,
+        -math.pi,
+        3 * math.pi,
+        3 * math.pi / 2,
+        -7.0,
+        1e6,
+        -1e6,
+    ],
+)
+def test_normalize_angle_wraps_into_half_open_range(a: float) -> None:
+    n = normalize_angle(a)
+
+    assert -math.pi <= n < math.pi
+    assert math.cos(n) == pytest.approx(math.cos(a), abs=1e-6)
+    assert math.sin(n) == pytest.approx(math.sin(a), abs=1e-6)
+
+
+def test_normalize_angle_keeps_in_range_values() -> None:
+    for a in (0.0, 1.0, -1.0, 3.0, -3.0):
+        assert normalize_angle(a) == a
+
+
+def test_clamp_bounds() -> None:
+    assert clamp(-1.0, 0.0, 1.0) == 0.0
+    assert clamp(2.0, 0.0, 1.0) == 1.0
+    assert clamp(0.25, 0.0, 1.0) == 0.25